@@ -50,6 +50,8 @@ class AppConfig:
     ANCHOR_ASPECT_MIN = 0.7                 # Min aspect ratio (w/h) for anchor square candidacy
     ANCHOR_ASPECT_MAX = 1.3                 # Max aspect ratio (w/h) for anchor square candidacy
     ANCHOR_THRESHOLD = 127                  # Threshold value for binary inversion in anchor detection
+    ANCHOR_DOWNSAMPLE_FACTOR = 4            # Downsample factor for anchor search on large scans
+    ANCHOR_DOWNSAMPLE_MIN_SIDE = 2000       # Min image side (px) before anchor search is downsampled
     # Zoom / image interaction parameters
     ZOOM_MIN_FACTOR = 0.05                  # Minimum zoom level
     ZOOM_MAX_FACTOR = 5.0                   # Maximum zoom level
@@ -91,10 +93,22 @@ class AppConfig:
     PDF_INSTRUCTION_SECTION_SPACING = 0.5 # inches spacing after instructions block
     PDF_FOOTER_Y = 0.5                    # inches from bottom for footer text
     PDF_ALIGNMENT_SQUARE_OFFSET = 0.5     # inches offset of alignment squares from page edges
+    # Student answer PDF layout (canvas-drawn)
+    PDF_LINE_SPACING = 1.2                # Leading as a multiple of font size
+    PDF_TITLE_SPACE_AFTER = 24            # points gap after the title block
+    PDF_INSTRUCTIONS_SPACE_AFTER = 36     # points gap after the instructions block
+    PDF_QUESTION_SPACE_AFTER = 8          # points gap between question text and its options
+    PDF_QUESTION_GAP = 18                 # points gap between consecutive questions
+    PDF_OPTION_FONT_SIZE = 11             # Font size of option rows
+    PDF_OPTION_MARKER_X = 20              # points indent of the option marker
+    PDF_OPTION_TEXT_X = 0.5               # inches indent of the option text column
+    PDF_OPTION_TEXT_WIDTH = 5.5           # inches width of the option text column
+    PDF_OPTION_ROW_PADDING = 6            # points vertical padding per option row
 
     # Export rendering configuration
     EXPORT_DPI = 150                      # Target DPI for exported coordinates/rasterization
     POINTS_PER_INCH = 72                  # ReportLab points per inch conversion
+    SCAN_DPI = EXPORT_DPI                 # Raster DPI for scanned PDFs; bubble/anchor pixel offsets assume EXPORT_DPI
     class PageSize(str, Enum):
         LETTER = 'letter'
         A4 = 'a4'
@@ -118,6 +132,9 @@ class AppConfig:
     # User interface layout configuration
     SPLITTER_SIZES = [300, 600, 250]       # Default panel widths for main interface
     TABLE_HEADER_HEIGHT = 40               # Header height for data tables
+    REFRESH_DEBOUNCE_MS = 150              # Idle delay before preview/validation refresh while typing
+    TOGGLE_DEBOUNCE_MS = 50                # Delay before re-rendering a preview after a checkbox toggle
+    EDIT_DEBOUNCE_MS = 50                  # Idle delay before editor keystrokes are written to the question
     COLUMN_WIDTHS = {                       # Optimal column widths for data display
         'student_name': 150,                # Student name column
         'student_id': 100,                  # Student ID column
@@ -145,6 +162,10 @@ class AppConfig:
     
     # File dialog filters are localized via i18n now
 
+    # Last directories used by the grading file dialogs (runtime state, not persisted)
+    last_export_dir = ""                    # Where results/reports were last exported
+    last_import_dir = ""                    # Where scan results were last loaded from
+
     # System font paths for cross-platform compatibility
     FONT_PATHS = {
         "Darwin": [                         # macOS font locations
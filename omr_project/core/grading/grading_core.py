@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Dict, List, NamedTuple
 from i18n import translator
 import csv
@@ -22,14 +23,36 @@ class GradeResult(NamedTuple):
     incorrect_count: int
     blank_count: int
     question_results: Dict[int, bool | None]
+    letter_grade: str  # Computed once when the result is created
 
 class GradingSystem:
     def __init__(self):
         self.results: List[GradeResult] = []
         self.log = get_logger(GRADING_LOGGER_NAME)
+        self._reset_totals()
+
+    def _reset_totals(self):
+        # Running class totals so stats stay O(1) per added student
+        self._sum = 0.0
+        self._passed = 0
+        self._highest = float('-inf')
+        self._lowest = float('inf')
 
     def clear(self):
         self.results.clear()
+        self._reset_totals()
+
+    def remove_result(self, index: int) -> GradeResult:
+        """Remove and return the result at `index`, keeping the class totals in step."""
+        result = self.results.pop(index)
+        p = result.percentage
+        self._sum -= p
+        self._passed -= p >= AppConfig.PASSING_PERCENTAGE
+        if p in (self._highest, self._lowest):
+            percentages = [r.percentage for r in self.results]
+            self._highest = max(percentages, default=float('-inf'))
+            self._lowest = min(percentages, default=float('inf'))
+        return result
 
     def calculate_grade(self, student_name: str, student_id: str,
                          student_answers: Dict[int, str],
@@ -64,11 +87,17 @@ class GradingSystem:
         percentage = (score / total_possible * 100) if total_possible > 0 else 0.0
         result = GradeResult(student_name, student_id, student_answers.copy(), answer_key.copy(),
                               points_per_question.copy(), score, total_possible, percentage,
-                              correct_count, incorrect_count, blank_count, question_results)
+                              correct_count, incorrect_count, blank_count, question_results,
+                              self.get_letter_grade(percentage))
         self.results.append(result)
+        self._sum += percentage
+        self._passed += percentage >= AppConfig.PASSING_PERCENTAGE
+        self._highest = max(self._highest, percentage)
+        self._lowest = min(self._lowest, percentage)
         return result
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def get_letter_grade(percentage: float) -> str:
         if percentage >= 90: return 'A'
         if percentage >= 80: return 'B'
@@ -109,7 +138,7 @@ class GradingSystem:
                         r.score,
                         r.total_possible,
                         f'{r.percentage:.1f}%',
-                        self.get_letter_grade(r.percentage),
+                        r.letter_grade,
                         r.correct_count,
                         r.incorrect_count,
                         r.blank_count,
@@ -134,7 +163,7 @@ class GradingSystem:
                     translator.t('csv_header_score'): r.score,
                     translator.t('csv_header_total_possible'): r.total_possible,
                     translator.t('csv_header_percentage'): r.percentage,
-                    translator.t('csv_header_letter_grade'): self.get_letter_grade(r.percentage),
+                    translator.t('csv_header_letter_grade'): r.letter_grade,
                     translator.t('csv_header_correct'): r.correct_count,
                     translator.t('csv_header_incorrect'): r.incorrect_count,
                     translator.t('csv_header_blank'): r.blank_count,
@@ -154,17 +183,13 @@ class GradingSystem:
 
     # Convenience stats helper to avoid duplicated logic
     def compute_stats(self) -> Dict[str, float]:
-        if not self.results:
-            return {"average": 0.0, "highest": 0.0, "lowest": 0.0, "pass_rate": 0.0}
-        percentages = [r.percentage for r in self.results]
-        avg_score = sum(percentages) / len(percentages)
-        highest_score = max(percentages)
-        lowest_score = min(percentages)
-        pass_count = sum(1 for p in percentages if p >= AppConfig.PASSING_PERCENTAGE)
-        pass_rate = (pass_count / len(percentages)) * 100
+        count = len(self.results)
+        if not count:
+            return {"count": 0, "average": 0.0, "highest": 0.0, "lowest": 0.0, "pass_rate": 0.0}
         return {
-            "average": avg_score,
-            "highest": highest_score,
-            "lowest": lowest_score,
-            "pass_rate": pass_rate,
+            "count": count,
+            "average": self._sum / count,
+            "highest": self._highest,
+            "lowest": self._lowest,
+            "pass_rate": (self._passed / count) * 100,
         }
@@ -1,17 +1,17 @@
+from typing import Any, Dict
+
 from config.app_config import AppConfig
 from config.font_config import FONT
+from core.models.form_model import Form
 from i18n.translator import get_option_letter
 from i18n import translator
 from config.logger_config import get_logger, PDF_LOGGER_NAME
 
 # ReportLab core
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, KeepTogether
-)
 from reportlab.pdfgen import canvas
  
 from reportlab.lib.units import inch
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.utils import simpleSplit
 
 
 from utils.page_size import get_reportlab_pagesize
@@ -20,74 +20,104 @@ from utils.page_size import get_reportlab_pagesize
 class PDFGeneratorMixin:
     """Mixin for PDF generation functionality"""
 
-    def _generate_pdf(self, filename: str):
-        """Generate student answer PDF."""
-        log = get_logger(PDF_LOGGER_NAME)
-        margins = AppConfig.PDF_MARGINS
-        doc = SimpleDocTemplate(
-            filename,
-            pagesize=get_reportlab_pagesize(),
-            rightMargin=margins['right'] * inch,
-            leftMargin=margins['left'] * inch,
-            topMargin=margins['top'] * inch,
-            bottomMargin=margins['bottom'] * inch,
-        )
-        styles = getSampleStyleSheet()
-        story = []
-
-        # Title
-        title_style = ParagraphStyle(
-            'Title', parent=styles['Heading1'], fontSize=AppConfig.FONT_SIZES['title'],
-            fontName=FONT, spaceAfter=12, alignment=1
-        )
-        safe_title = str(self.form.title).replace('<', '&lt;').replace('>', '&gt;')
-        story.append(Paragraph(safe_title, title_style))
-        story.append(Spacer(1, 12))
-
-        # Instructions
-        if self.form.instructions:
-            inst_style = ParagraphStyle(
-                'Instructions', parent=styles['Normal'], fontSize=AppConfig.FONT_SIZES['normal'],
-                fontName=FONT, spaceAfter=18, alignment=1
-            )
-            story.append(Paragraph(self.form.instructions, inst_style))
-            story.append(Spacer(1, 18))
-
-        # Questions
-        for i, q in enumerate(self.form.questions):
-            elements = []
-            q_style = ParagraphStyle(
-                'Question', parent=styles['Normal'], fontSize=AppConfig.FONT_SIZES['normal'],
-                fontName=FONT, spaceAfter=8
-            )
-            elements.append(Paragraph(f"{i+1}. {q.text}", q_style))
-
-            non_empty_options = q.get_non_empty_options()
-            options = [[f"○ {get_option_letter(j)}.", opt] for j, opt in enumerate(non_empty_options)]
-            table = Table(options, colWidths=[0.5*inch, 5.5*inch])
-            table.setStyle(TableStyle([
-                ('FONTNAME', (0, 0), (-1, -1), FONT),
-                ('FONTSIZE', (0, 0), (-1, -1), 11),
-                ('LEFTPADDING', (0, 0), (0, -1), 20),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ]))
-            elements.append(table)
-            story.append(KeepTogether(elements))
-            if i < len(self.form.questions) - 1:
-                story.append(Spacer(1, 18))
+    def _generate_pdf(self, filename: str) -> bool:
+        """Generate student answer PDF.
 
+        Drawn directly on a canvas in a single pass: each question block is
+        measured up front and moved to a new page when it would not fit.
+        Errors are logged and re-raised for the caller to report.
+        """
+        log = get_logger(PDF_LOGGER_NAME)
         try:
-            doc.build(story)
+            pagesize = get_reportlab_pagesize()
+            width, height = pagesize
+            margins = AppConfig.PDF_MARGINS
+            left = margins['left'] * inch
+            top = height - margins['top'] * inch
+            bottom = margins['bottom'] * inch
+            text_width = width - left - margins['right'] * inch
+            normal_size = AppConfig.FONT_SIZES['normal']
+            c = canvas.Canvas(filename, pagesize=pagesize)
+
+            # Title
+            y = self._draw_centered_block(c, str(self.form.title), AppConfig.FONT_SIZES['title'],
+                                          width, text_width, top, top, bottom)
+            y -= AppConfig.PDF_TITLE_SPACE_AFTER
+
+            # Instructions
+            if self.form.instructions:
+                y = self._draw_centered_block(c, self.form.instructions, normal_size, width, text_width,
+                                              y, top, bottom)
+                y -= AppConfig.PDF_INSTRUCTIONS_SPACE_AFTER
+
+            # Questions
+            question_leading = normal_size * AppConfig.PDF_LINE_SPACING
+            option_leading = AppConfig.PDF_OPTION_FONT_SIZE * AppConfig.PDF_LINE_SPACING
+            option_x = AppConfig.PDF_OPTION_TEXT_X * inch
+            option_text_width = min(AppConfig.PDF_OPTION_TEXT_WIDTH * inch, text_width - option_x)
+            for i, q in enumerate(self.form.questions):
+                text_lines = simpleSplit(f"{i+1}. {q.text}", FONT, normal_size, text_width)
+                option_rows = [
+                    (f"○ {get_option_letter(j)}.", simpleSplit(opt, FONT, AppConfig.PDF_OPTION_FONT_SIZE, option_text_width) or [''])
+                    for j, opt in enumerate(q.get_non_empty_options())
+                ]
+                block_height = (len(text_lines) * question_leading + AppConfig.PDF_QUESTION_SPACE_AFTER
+                                + sum(len(lines) * option_leading + AppConfig.PDF_OPTION_ROW_PADDING for _, lines in option_rows))
+                # Keep each question on one page when it fits on one; taller
+                # questions are broken line by line below
+                if y - block_height < bottom and block_height <= top - bottom:
+                    c.showPage()
+                    y = top
+
+                c.setFont(FONT, normal_size)
+                for line in text_lines:
+                    y = self._next_line(c, y, question_leading, normal_size, top, bottom)
+                    c.drawString(left, y, line)
+                y -= AppConfig.PDF_QUESTION_SPACE_AFTER
+
+                c.setFont(FONT, AppConfig.PDF_OPTION_FONT_SIZE)
+                for marker, lines in option_rows:
+                    for k, line in enumerate(lines):
+                        y = self._next_line(c, y, option_leading, AppConfig.PDF_OPTION_FONT_SIZE, top, bottom)
+                        if k == 0:
+                            c.drawString(left + AppConfig.PDF_OPTION_MARKER_X, y, marker)
+                        c.drawString(left + option_x, y, line)
+                    y -= AppConfig.PDF_OPTION_ROW_PADDING
+                y -= AppConfig.PDF_QUESTION_GAP
+
+            c.save()
             log.info("Generated PDF: %s (questions=%d)", filename, len(self.form.questions))
+            return True
         except Exception as e:  # noqa: BLE001
             log.exception("Error generating PDF '%s': %s", filename, e)
-
-    def _generate_omr_sheet(self, filename: str):
-        """Generate OMR answer sheet PDF."""
+            raise
+
+    def _draw_centered_block(self, c, text: str, font_size: float, width: float,
+                             text_width: float, y: float, top: float, bottom: float) -> float:
+        """Draw `text` wrapped and centred below `y`; return the baseline of the last line."""
+        c.setFont(FONT, font_size)
+        leading = font_size * AppConfig.PDF_LINE_SPACING
+        for line in simpleSplit(text, FONT, font_size, text_width):
+            y = self._next_line(c, y, leading, font_size, top, bottom)
+            c.drawCentredString(width/2, y, line)
+        return y
+
+    @staticmethod
+    def _next_line(c, y: float, leading: float, font_size: float, top: float, bottom: float) -> float:
+        """Return the baseline one line below `y`, starting a new page if it would cross `bottom`."""
+        if y - leading < bottom:
+            c.showPage()
+            c.setFont(FONT, font_size)  # Font state does not carry over to the new page
+            y = top
+        return y - leading
+
+    def _generate_omr_sheet(self, filename: str) -> bool:
+        """Generate OMR answer sheet PDF; errors are logged and re-raised."""
         log = get_logger(PDF_LOGGER_NAME)
         try:
-            c = canvas.Canvas(filename, pagesize=get_reportlab_pagesize())
-            width, height = get_reportlab_pagesize()
+            pagesize = get_reportlab_pagesize()
+            c = canvas.Canvas(filename, pagesize=pagesize)
+            width, height = pagesize
             y = self._draw_omr_header(c, width, height)
             y = self._draw_student_info_section(c, width, y)
             y = self._draw_instructions_section(c, width, y)
@@ -95,8 +125,10 @@ class PDFGeneratorMixin:
             self._draw_omr_footer(c, width)
             c.save()
             log.info("Generated OMR sheet: %s (questions=%d)", filename, len(self.form.questions))
+            return True
         except Exception as e:  # noqa: BLE001
             log.exception("Error generating OMR sheet '%s': %s", filename, e)
+            raise
 
     def _draw_omr_header(self, c, width, height):
         c.setFont(FONT, AppConfig.FONT_SIZES['title'])
@@ -157,11 +189,14 @@ class PDFGeneratorMixin:
         start_x = AppConfig.PDF_QUESTION_BUBBLE_START_X * inch
         question = self.form.questions[question_index]
         option_count = question.get_option_count()
+        # Emit all bubbles of the row as a single path instead of one per option
+        bubbles = c.beginPath()
+        for j in range(option_count):
+            bubbles.circle(start_x + j * bubble_spacing, y + 5, bubble_radius)
+        c.drawPath(bubbles, stroke=1, fill=0)
+        c.setFont(FONT, AppConfig.FONT_SIZES['instruction'])
         for j in range(option_count):
-            x = start_x + j * bubble_spacing
-            c.circle(x, y + 5, bubble_radius, fill=0, stroke=1)
-            c.setFont(FONT, AppConfig.FONT_SIZES['instruction'])
-            c.drawCentredString(x, y - 0.25 * inch, get_option_letter(j))
+            c.drawCentredString(start_x + j * bubble_spacing, y - 0.25 * inch, get_option_letter(j))
         return y - question_height
 
     def _draw_alignment_points(self, c, width, height):
@@ -184,3 +219,27 @@ class PDFGeneratorMixin:
         c.setFont(FONT, AppConfig.FONT_SIZES['small'])
         footer_text = f"{translator.t('total_questions')} {len(self.form.questions)} | {translator.t('total_points')} {sum(q.points for q in self.form.questions)}"
         c.drawCentredString(width/2, AppConfig.PDF_FOOTER_Y * inch, footer_text)
+
+
+class FormPDFGenerator(PDFGeneratorMixin):
+    """Standalone PDF generator for a form, usable outside the designer widget."""
+
+    def __init__(self, form: Form):
+        self.form = form
+
+
+class PdfGenerationCommand:
+    """Worker command generating a form PDF (`kind` is 'pdf' or 'omr_sheet')."""
+
+    def __init__(self, form: Form, filename: str, kind: str):
+        # Snapshot the form so edits made while the worker runs don't leak in
+        self.form = Form.from_dict(form.to_dict())
+        self.filename = filename
+        self.kind = kind
+
+    def execute(self) -> Dict[str, Any]:  # noqa: D401
+        generator = FormPDFGenerator(self.form)
+        build = generator._generate_omr_sheet if self.kind == 'omr_sheet' else generator._generate_pdf
+        # Failures propagate so WorkerThread.run reports the original exception
+        build(self.filename)
+        return {'success': True, 'filename': self.filename, 'kind': self.kind, 'message': ''}
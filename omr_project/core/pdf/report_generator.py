@@ -66,24 +66,25 @@ def generate_class_report(grading_system, filename: str) -> bool:
         # Student Results Table
         story.append(Paragraph(translator.t('individual_results'), styles['Heading2']))
 
-        student_data = [[
+        header = [
             translator.t('student_name_field').replace(':',''),
             translator.t('student_id_field').replace(':',''),
             translator.t('score_label').replace(':',''),
             translator.t('total_label').replace(':',''),
             translator.t('percentage_label').replace(':',''),
             translator.t('grade_label').replace(':','')
-        ]]
-
-        for result in grading_system.results:
-            student_data.append([
+        ]
+        student_data = [header] + [
+            [
                 result.student_name,
                 result.student_id,
                 str(result.score),
                 str(result.total_possible),
                 f"{result.percentage:.1f}%",
-                grading_system.get_letter_grade(result.percentage)
-            ])
+                result.letter_grade
+            ]
+            for result in grading_system.results
+        ]
 
         student_table = Table(student_data)
         student_table.setStyle(TableStyle([
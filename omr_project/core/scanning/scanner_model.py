@@ -1,7 +1,44 @@
+import weakref
 import numpy as np
-from typing import NamedTuple, Tuple, Dict
+from typing import ClassVar, NamedTuple, Optional, Tuple, Dict, List
 from PIL import Image
 from config.app_config import AppConfig
+from core.scanning._kernels import flat_circle_offsets, score_bubbles
+
+_array_cache: Optional[Tuple[weakref.ref, np.ndarray]] = None  # Last image handed to image_array
+
+
+def _drop_array(ref: weakref.ref) -> None:
+    """Release the cached array once the image it was converted from is gone."""
+    global _array_cache
+    if _array_cache is not None and _array_cache[0] is ref:
+        _array_cache = None
+
+
+def clear_image_caches() -> None:
+    """Forget the cached pixel arrays of the last scan, e.g. when a new one is loaded."""
+    global _array_cache
+    _array_cache = None
+    if BubbleDetector._instance is not None:
+        BubbleDetector._instance._gray_cache = None
+
+
+def image_array(image: Image.Image) -> np.ndarray:
+    """
+    Return the pixels of `image` as a NumPy array, shared by every caller.
+
+    Anchor detection and bubble analysis run on the same scan, so the
+    array is memoized on the identity of the most recent image and
+    converted only once per scan.
+    """
+    global _array_cache
+    cached = _array_cache
+    if cached is not None and cached[0]() is image:
+        return cached[1]
+    arr = np.asarray(image)
+    _array_cache = (weakref.ref(image, _drop_array), arr)
+    return arr
+
 
 class BubbleAnalysisResult(NamedTuple):
     """
@@ -38,10 +75,92 @@ class BubbleDetector:
         filled_threshold (float): Darkness threshold for filled detection (0.0-1.0)
     """
 
+    _instance: ClassVar[Optional['BubbleDetector']] = None  # Process-wide shared detector
+
     def __init__(self):
         """Initialize bubble detector with configuration from AppConfig."""
         self.analysis_radius = AppConfig.ANALYSIS_RADIUS    # Size of analysis area
         self.filled_threshold = AppConfig.FILLED_THRESHOLD  # Darkness threshold
+        self._gray_cache: Optional[Tuple[weakref.ref, np.ndarray]] = None  # Last converted image
+        self._mask_cache: Dict[Tuple[int, int], np.ndarray] = {}  # Flat circle offsets per (radius, width)
+
+    @classmethod
+    def get_default(cls) -> 'BubbleDetector':
+        """Return the shared detector, created on first use so its mask cache is built once."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _mask_offsets(self, width: int) -> np.ndarray:
+        """Return the flat circular sampling mask for the current radius and an image width."""
+        key = (int(self.analysis_radius), width)
+        mask = self._mask_cache.get(key)
+        if mask is None:
+            mask = self._mask_cache[key] = flat_circle_offsets(key[0], width)
+        return mask
+
+    def _score_centers(self, gray: np.ndarray, centers: np.ndarray) -> List[BubbleAnalysisResult]:
+        """Score a batch of (x, y) bubble centers with the compiled kernel."""
+        darkness, filled, confidence = score_bubbles(
+            gray, centers, self._mask_offsets(gray.shape[1]), int(self.analysis_radius), float(self.filled_threshold)
+        )
+        return [BubbleAnalysisResult(float(d), bool(f), float(c))
+                for d, f, c in zip(darkness, filled, confidence)]
+
+    def _to_gray(self, image: Image.Image) -> np.ndarray:
+        """
+        Convert an image to a grayscale uint8 array, reusing the last result.
+
+        The conversion is memoized on the identity of the most recently seen
+        image, so analyzing many bubbles on the same scan converts the pixels
+        only once. The image is held through a weak reference whose callback
+        drops the array when the image is collected.
+
+        Args:
+            image (Image.Image): Input image to convert
+
+        Returns:
+            np.ndarray: 2D array of luminance values (0-255)
+        """
+        cached = self._gray_cache
+        if cached is not None and cached[0]() is image:
+            return cached[1]
+
+        # Convert PIL image to numpy array for processing (shared with anchor detection)
+        img_array = image_array(image)
+
+        # Convert to grayscale using standard RGB weights if needed
+        if len(img_array.shape) == 3:
+            # RGB to grayscale conversion using standard luminance weights, rounded to uint8
+            gray = (np.dot(img_array[...,:3], [0.299, 0.587, 0.114]) + 0.5).astype(np.uint8)
+        elif img_array.dtype != np.uint8:
+            gray = np.clip(img_array, 0, 255).astype(np.uint8)
+        else:
+            gray = img_array
+
+        gray = np.ascontiguousarray(gray)
+        self._gray_cache = (weakref.ref(image, self._drop_gray), gray)
+        return gray
+
+    def _drop_gray(self, ref: weakref.ref) -> None:
+        """Release the cached grayscale array once its source image is gone."""
+        if self._gray_cache is not None and self._gray_cache[0] is ref:
+            self._gray_cache = None
+
+    def _score_gray(self, gray: np.ndarray, center_x: int, center_y: int) -> BubbleAnalysisResult:
+        """
+        Score a single bubble on an already converted grayscale array.
+
+        Args:
+            gray (np.ndarray): Grayscale image array from `_to_gray`
+            center_x (int): X coordinate of bubble center
+            center_y (int): Y coordinate of bubble center
+
+        Returns:
+            BubbleAnalysisResult: Analysis result with darkness score, fill status, and confidence
+        """
+        centers = np.array([[center_x, center_y]], dtype=np.int64)
+        return self._score_centers(gray, centers)[0]
 
     def analyze_bubble(self, image: Image.Image, center_x: int, center_y: int) -> BubbleAnalysisResult:
         """
@@ -60,52 +179,31 @@ class BubbleDetector:
             BubbleAnalysisResult: Analysis result with darkness score, fill status, and confidence
         """
         try:
-            # Convert PIL image to numpy array for processing
-            img_array = np.array(image)
-            
-            # Convert to grayscale using standard RGB weights if needed
-            if len(img_array.shape) == 3:
-                # RGB to grayscale conversion using standard luminance weights
-                gray = np.dot(img_array[...,:3], [0.299, 0.587, 0.114])
-            else:
-                gray = img_array.astype(float)
-
-            height, width = gray.shape
-            
-            # Check if analysis area is within image bounds
-            if (center_x - self.analysis_radius < 0 or center_x + self.analysis_radius >= width or
-                center_y - self.analysis_radius < 0 or center_y + self.analysis_radius >= height):
-                return BubbleAnalysisResult(0.0, False, 0.0)
-
-            # Sample pixel values within circular area around bubble center
-            pixel_values = []
-            for dy in range(-self.analysis_radius, self.analysis_radius + 1):
-                for dx in range(-self.analysis_radius, self.analysis_radius + 1):
-                    # Only include pixels within the circular radius
-                    if dx*dx + dy*dy <= self.analysis_radius*self.analysis_radius:
-                        pixel_values.append(gray[center_y + dy, center_x + dx])
-
-            # Handle edge case of no valid pixels
-            if not pixel_values:
-                return BubbleAnalysisResult(0.0, False, 0.0)
-
-            # Calculate statistics for bubble analysis
-            mean_intensity = np.mean(pixel_values)
-            darkness_score = (255.0 - mean_intensity) / 255.0  # Convert to 0-1 scale (higher = darker)
-            
-            # Confidence based on pixel value consistency (lower std dev = higher confidence)
-            confidence = max(0.0, 1.0 - (np.std(pixel_values) / 100.0))
-            
-            # Determine if bubble is filled based on threshold
-            is_filled = darkness_score >= self.filled_threshold
-
-            return BubbleAnalysisResult(darkness_score, is_filled, min(1.0, confidence))
-
+            return self._score_gray(self._to_gray(image), center_x, center_y)
         except Exception:
             # Return safe defaults if analysis fails
             return BubbleAnalysisResult(0.0, False, 0.0)
 
-    def analyze_all_bubbles(self, image: Image.Image, positions: Dict[int, Dict[str, Tuple[float, float]]]) -> Tuple[Dict, Dict]:
+    @staticmethod
+    def bubble_arrays(positions: Dict[int, Dict[str, Tuple[float, float]]]) -> Tuple[List[Tuple[int, str]], np.ndarray]:
+        """
+        Flatten bubble positions into parallel arrays for batch scoring.
+
+        Args:
+            positions (Dict): Bubble positions by question number and option
+
+        Returns:
+            tuple: (keys, centers)
+                - keys: (question, option) per bubble, in position order
+                - centers: (N, 2) int64 array of (x, y) bubble centers
+        """
+        keys = [(q_num, option) for q_num, options in positions.items() for option in options]
+        centers = np.array([(int(x), int(y)) for options in positions.values() for x, y in options.values()],
+                           dtype=np.int64).reshape(-1, 2)
+        return keys, centers
+
+    def analyze_all_bubbles(self, image: Image.Image, positions: Dict[int, Dict[str, Tuple[float, float]]],
+                            arrays: Optional[Tuple[List[Tuple[int, str]], np.ndarray]] = None) -> Tuple[Dict, Dict]:
         """
         Analyze all bubbles in an image and determine student answers.
         
@@ -116,6 +214,8 @@ class BubbleDetector:
         Args:
             image (Image.Image): Scanned OMR sheet image
             positions (Dict): Bubble positions by question number and option
+            arrays (tuple, optional): `bubble_arrays(positions)`, when the caller
+                already holds them (e.g. re-analysis after a threshold change)
             
         Returns:
             tuple: (analysis_results, student_answers)
@@ -125,18 +225,28 @@ class BubbleDetector:
         results = {}
         answers = {}
 
-        # Process each question
-        for q_num, options in positions.items():
-            results[q_num] = {}
-            filled_options = []
+        # Convert once per sheet instead of once per bubble
+        try:
+            gray = self._to_gray(image)
+        except Exception:
+            gray = None
 
-            # Analyze each option bubble for this question
-            for option, (x, y) in options.items():
-                analysis = self.analyze_bubble(image, int(x), int(y))
-                results[q_num][option] = analysis
+        # Score every bubble of the sheet in a single kernel call
+        keys, centers = arrays if arrays is not None else self.bubble_arrays(positions)
+        if gray is not None:
+            scored = self._score_centers(gray, centers)
+        else:
+            scored = [BubbleAnalysisResult(0.0, False, 0.0)] * len(keys)
 
-                if analysis.is_filled and analysis.confidence >= 0.8:
-                    filled_options.append((option, analysis.darkness_score))
+        for q_num in positions:
+            results[q_num] = {}
+        for (q_num, option), analysis in zip(keys, scored):
+            results[q_num][option] = analysis
+
+        # Process each question
+        for q_num, options in results.items():
+            filled_options = [(option, analysis.darkness_score) for option, analysis in options.items()
+                              if analysis.is_filled and analysis.confidence >= 0.8]
 
             # Select answer: single filled bubble or darkest if multiple
             if len(filled_options) == 1:
@@ -1,10 +1,30 @@
-from typing import Dict, Protocol, Any
+import threading
+from typing import Dict, Optional, Protocol, Any, Tuple
 
 import numpy as np
 from PyQt6.QtCore import QThread, pyqtSignal
 from PIL import Image
 from config.app_config import AppConfig
 from core.scanning.opencv import CV2_AVAILABLE, cv2
+from core.scanning.scanner_model import BubbleDetector, image_array
+
+# Scratch images reused across scans of the same resolution. Every scan runs
+# on a fresh QThread, so they live at module level; the lock is held for a
+# whole detection because the buffers are only valid until the next one.
+_SCRATCH_LOCK = threading.Lock()
+_SCRATCH: Dict[str, np.ndarray] = {}
+
+
+def _scratch_buffer(name: str, shape: Tuple[int, ...]) -> np.ndarray:
+    """Return the uint8 buffer `name`, reallocated only when the shape changes.
+
+    Callers must hold `_SCRATCH_LOCK`.
+    """
+    buf = _SCRATCH.get(name)
+    if buf is None or buf.shape != shape:
+        buf = _SCRATCH[name] = np.empty(shape, dtype=np.uint8)
+    return buf
+
 
 class TaskCommand(Protocol):  # pragma: no cover - structural typing aid
     def execute(self) -> Dict[str, Any]: ...
@@ -19,14 +39,15 @@ class AnchorDetectionCommand:
 
 
 class BubbleAnalysisCommand:
-    def __init__(self, detector, image: Image.Image, positions):
-        self.detector = detector
+    def __init__(self, detector: Optional[BubbleDetector], image: Image.Image, positions, arrays=None):
+        self.detector = detector or BubbleDetector.get_default()
         self.image = image
         self.positions = positions
+        self.arrays = arrays  # Optional precomputed BubbleDetector.bubble_arrays(positions)
 
     def execute(self) -> Dict[str, Any]:  # noqa: D401
         try:
-            results, answers = self.detector.analyze_all_bubbles(self.image, self.positions)
+            results, answers = self.detector.analyze_all_bubbles(self.image, self.positions, self.arrays)
             return {'success': True, 'results': results, 'answers': answers}
         except Exception as e:  # noqa: BLE001
             return {'success': False, 'message': str(e), 'results': {}, 'answers': {}}
@@ -45,47 +66,80 @@ class WorkerThread(QThread):
             result = self._command.execute()
             self.result_ready.emit(result)
         except Exception as e:  # noqa: BLE001
-            self.result_ready.emit({'success': False, 'message': str(e)})
+            # The exception itself travels along so callers can tell e.g. permission errors apart
+            self.result_ready.emit({'success': False, 'message': str(e), 'error': e})
 
     @staticmethod
     def _detect_anchors_static(image: Image.Image) -> Dict:
         if not CV2_AVAILABLE:
             return {'success': False, 'message': 'OpenCV not available', 'anchors': {}}
-        img_array = np.array(image)
-        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY) if len(img_array.shape) == 3 else img_array
+        with _SCRATCH_LOCK:
+            return WorkerThread._locate_anchors(image)
+
+    @staticmethod
+    def _locate_anchors(image: Image.Image) -> Dict:
+        """Find the four corner anchors; runs under `_SCRATCH_LOCK`."""
+        img_array = image_array(image)
+        if len(img_array.shape) == 3:
+            gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY, dst=_scratch_buffer('gray', img_array.shape[:2]))
+        else:
+            gray = img_array
         margin, size = AppConfig.ANCHOR_MARGIN, AppConfig.ANCHOR_SIZE
+        W, H = image.width, image.height
         expected = {
             'top_left': (margin, margin),
-            'top_right': (image.width - margin - size, margin),
-            'bottom_left': (margin, image.height - margin - size),
-            'bottom_right': (image.width - margin - size, image.height - margin - size)
+            'top_right': (W - margin - size, margin),
+            'bottom_left': (margin, H - margin - size),
+            'bottom_right': (W - margin - size, H - margin - size)
         }
-        _, binary = cv2.threshold(gray, AppConfig.ANCHOR_THRESHOLD, 255, cv2.THRESH_BINARY_INV)
-        contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        candidates = []
-        for contour in contours:
-            x, y, w, h = cv2.boundingRect(contour)
-            if (AppConfig.ANCHOR_CONTOUR_MIN <= w <= AppConfig.ANCHOR_CONTOUR_MAX and
-                AppConfig.ANCHOR_CONTOUR_MIN <= h <= AppConfig.ANCHOR_CONTOUR_MAX and
-                AppConfig.ANCHOR_ASPECT_MIN <= w / h <= AppConfig.ANCHOR_ASPECT_MAX):
-                candidates.append((x, y, w, h))
+        # Large scans are searched at reduced resolution; boxes are scaled back afterwards
+        factor = AppConfig.ANCHOR_DOWNSAMPLE_FACTOR if min(gray.shape[:2]) >= AppConfig.ANCHOR_DOWNSAMPLE_MIN_SIDE else 1
+        if factor > 1:
+            small_shape = (gray.shape[0] // factor, gray.shape[1] // factor)
+            search = cv2.resize(gray, small_shape[::-1], dst=_scratch_buffer('small', small_shape),
+                                interpolation=cv2.INTER_AREA)
+        else:
+            search = gray
+        _, binary = cv2.threshold(search, AppConfig.ANCHOR_THRESHOLD, 255, cv2.THRESH_BINARY_INV,
+                                  dst=_scratch_buffer('binary', search.shape))
+        # Bounding boxes of all connected blobs in one call (row 0 is the background)
+        _, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+        x = stats[1:, cv2.CC_STAT_LEFT] * factor
+        y = stats[1:, cv2.CC_STAT_TOP] * factor
+        w = stats[1:, cv2.CC_STAT_WIDTH] * factor
+        h = stats[1:, cv2.CC_STAT_HEIGHT] * factor
+        aspect = w / np.maximum(h, 1)
+        keep = ((AppConfig.ANCHOR_CONTOUR_MIN <= w) & (w <= AppConfig.ANCHOR_CONTOUR_MAX) &
+                (AppConfig.ANCHOR_CONTOUR_MIN <= h) & (h <= AppConfig.ANCHOR_CONTOUR_MAX) &
+                (AppConfig.ANCHOR_ASPECT_MIN <= aspect) & (aspect <= AppConfig.ANCHOR_ASPECT_MAX))
+        candidates = np.stack([x[keep], y[keep], w[keep], h[keep]], axis=1)
         anchors = {}
-        for name, (exp_x, exp_y) in expected.items():
-            best_dist = float('inf')
-            best_candidate = None
-            for x, y, w, h in candidates:
-                center_x, center_y = x + w/2, y + h/2
-                dist = (center_x - (exp_x + size/2))**2 + (center_y - (exp_y + size/2))**2
-                if dist < best_dist:
-                    best_dist = dist
-                    best_candidate = (x, y, w, h)
-            if best_candidate:
-                bx, by, bw, bh = best_candidate
+        if len(candidates):
+            # Squared distance from every expected anchor center to every candidate center
+            cand = (candidates[:, :2] + candidates[:, 2:] / 2).astype(np.float32)
+            expected_arr = np.asarray([(ex + size/2, ey + size/2) for ex, ey in expected.values()], dtype=np.float32)
+            d2 = ((cand[None, :, :] - expected_arr[:, None, :]) ** 2).sum(-1)
+            for name, best in zip(expected, d2.argmin(1)):
+                bx, by, bw, bh = candidates[best]
+                if factor > 1:
+                    bx, by, bw, bh = WorkerThread._refine_anchor(gray, int(bx), int(by), int(bw), int(bh), factor)
                 anchors[name] = {"x": int(bx), "y": int(by), "width": int(bw), "height": int(bh)}
         if len(anchors) < 4:
             return {'success': False, 'message': 'Failed to detect all anchors', 'anchors': anchors}
         return {'success': True, 'message': 'Anchors detected', 'anchors': anchors}
 
+    @staticmethod
+    def _refine_anchor(gray, x: int, y: int, w: int, h: int, pad: int):
+        """Recompute a coarse anchor box at full resolution from a small window around it."""
+        x0, y0 = max(0, x - pad), max(0, y - pad)
+        x1, y1 = min(gray.shape[1], x + w + pad), min(gray.shape[0], y + h + pad)
+        _, window = cv2.threshold(gray[y0:y1, x0:x1], AppConfig.ANCHOR_THRESHOLD, 255, cv2.THRESH_BINARY_INV)
+        points = cv2.findNonZero(window)
+        if points is None:
+            return x, y, w, h
+        rx, ry, rw, rh = cv2.boundingRect(points)
+        return x0 + rx, y0 + ry, rw, rh
+
     # Legacy method names retained for backward compatibility (optional)
     def _detect_anchors(self, image: Image.Image) -> Dict:  # pragma: no cover
         return self._detect_anchors_static(image)
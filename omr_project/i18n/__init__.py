@@ -1,8 +1,9 @@
 # Package for internationalization (i18n)
-from .translator import translator, t, get_option_letter
+from .translator import translator, t, get_option_letter, first_option_letters
 
 __all__ = [
     "translator",
     "t",
     "get_option_letter",
+    "first_option_letters",
 ]
@@ -6,64 +6,104 @@ Provides fallback to English and logs missing keys for visibility.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 import json
-from typing import Dict, Any
+import sys
+from typing import Dict, Any, Tuple
 from config.logger_config import get_logger, APP_LOGGER_NAME
+try:
+    import orjson  # type: ignore
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    ORJSON_AVAILABLE = False
 
 _LOG = get_logger(APP_LOGGER_NAME)
 
 LOCALES_DIR = Path(__file__).parent / "locales"
 DEFAULT_LANG = "en"
 
+# Answer option letters per language (Latin letters for everything else)
+_LATIN_LETTERS = tuple(chr(65 + i) for i in range(26))
+_OPTION_LETTERS = {
+    'el': ('Α', 'Β', 'Γ', 'Δ'),
+}
+
 
 class Translator:
     def __init__(self):
         self.current_language = DEFAULT_LANG
         self.translations: Dict[str, Dict[str, str]] = {}
         self._missing: set[str] = set()
+        self._current_map: Dict[str, str] = {}
+        self.option_letters: tuple[str, ...] = _LATIN_LETTERS
         self._load_all_locales()
+        self._rebuild_lookup()
 
     def _load_all_locales(self):
+        """Discover available locale files; only the default one is parsed now."""
+        self._locale_files: Dict[str, Path] = {}
         if not LOCALES_DIR.exists():  # pragma: no cover
             _LOG.warning("Locales directory missing: %s", LOCALES_DIR)
-            return
-        for file in LOCALES_DIR.glob("*.json"):
-            try:
-                with file.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-                if isinstance(data, dict):
-                    self.translations[file.stem] = {k: str(v) for k, v in data.items()}
-                    _LOG.debug("Loaded locale '%s' with %d keys", file.stem, len(data))
-            except Exception as e:  # pragma: no cover
-                _LOG.error("Failed loading locale %s: %s", file.name, e)
+        else:
+            self._locale_files = {file.stem: file for file in LOCALES_DIR.glob("*.json")}
+        self._ensure_loaded(DEFAULT_LANG)
         if DEFAULT_LANG not in self.translations:
             self.translations[DEFAULT_LANG] = {}
 
-    def set_language(self, lang_code: str):
+    def _ensure_loaded(self, lang_code: str) -> bool:
+        """Parse a locale file on first use; return True if the language is available."""
         if lang_code in self.translations:
+            return True
+        file = self._locale_files.get(lang_code)
+        if file is None:
+            return False
+        try:
+            raw = file.read_bytes()
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw.decode("utf-8"))
+            if isinstance(data, dict):
+                self.translations[lang_code] = {sys.intern(k): sys.intern(str(v)) for k, v in data.items()}
+                _LOG.debug("Loaded locale '%s' with %d keys", lang_code, len(data))
+                return True
+        except Exception as e:  # pragma: no cover
+            _LOG.error("Failed loading locale %s: %s", file.name, e)
+        return False
+
+    def _rebuild_lookup(self):
+        """Merge the current language over the default into one lookup dict."""
+        default_map = self.translations.get(DEFAULT_LANG, {})
+        lang_map = self.translations.get(self.current_language, {})
+        self._current_map = {**default_map, **lang_map}
+        self.option_letters = _OPTION_LETTERS.get(self.current_language, _LATIN_LETTERS)
+        missing = len(default_map.keys() - lang_map.keys())
+        if missing and self.current_language != DEFAULT_LANG:
+            _LOG.debug("%d keys missing in language '%s' (using default)", missing, self.current_language)
+
+    def set_language(self, lang_code: str):
+        if self._ensure_loaded(lang_code):
             self.current_language = lang_code
+            self._rebuild_lookup()
         else:  # pragma: no cover
             _LOG.warning("Requested unknown language '%s'", lang_code)
 
+    def current_lang(self) -> str:
+        """Return the active language code (useful as a cache key for translations)."""
+        return self.current_language
+
     def t(self, key: str) -> str:
-        lang_map = self.translations.get(self.current_language, {})
-        if key in lang_map:
-            return lang_map[key]
-        # fallback to default
-        default_map = self.translations.get(DEFAULT_LANG, {})
-        if key in default_map:
-            # log missing for current language only once
-            missing_id = f"{self.current_language}:{key}"
-            if missing_id not in self._missing:
-                self._missing.add(missing_id)
-                _LOG.debug("Missing key '%s' in language '%s' (using default)", key, self.current_language)
-            return default_map[key]
-        # total miss
+        value = self._current_map.get(key)
+        if value is not None:
+            return value
+        return self._miss(key)
+
+    def _miss(self, key: str) -> str:
+        # total miss; the token is memoized in the merged map (rebuilt on language
+        # change) so repeated lookups of the same key stay a single dict hit
         miss_token = f"[{key}]"
         if key not in self._missing:
             self._missing.add(key)
             _LOG.warning("Missing translation key '%s' in all languages", key)
+        self._current_map[key] = miss_token
         return miss_token
 
 
@@ -72,7 +112,15 @@ t = translator.t
 
 
 def get_option_letter(index: int) -> str:
-    if translator.current_language == 'el':
-        greek_letters = ['Α', 'Β', 'Γ', 'Δ']
-        return greek_letters[index] if index < len(greek_letters) else chr(65 + index)
-    return chr(65 + index)
+    letters = translator.option_letters
+    return letters[index] if index < len(letters) else chr(65 + index)
+
+
+@lru_cache(maxsize=None)
+def _option_letters_for(letters: Tuple[str, ...], count: int) -> Tuple[str, ...]:
+    return tuple(letters[i] if i < len(letters) else chr(65 + i) for i in range(count))
+
+
+def first_option_letters(count: int) -> Tuple[str, ...]:
+    """The first `count` letters of `translator.option_letters`, built once per language."""
+    return _option_letters_for(translator.option_letters, count)
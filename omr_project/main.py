@@ -51,8 +51,7 @@ def main():
     if dm is not None:
         val = str(dm).lower() in ('1', 'true', 'yes')
         unified_app.dark_mode = val
-        from ui.app_style import get_styles as _styles
-        unified_app.setStyleSheet(_styles(unified_app.dark_mode))
+        unified_app.apply_theme()
     unified_app.show()
     log.info("Application UI displayed")
 
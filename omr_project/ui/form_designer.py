@@ -3,7 +3,8 @@ from core.models.form_model import Form
 from config.app_config import AppConfig
 from utils.error_handling import ErrorHandler
 from ui.import_dialog import ImportDialog  # ImportDialog now standalone module
-from core.pdf.pdf_generator import PDFGeneratorMixin
+from core.pdf.pdf_generator import PDFGeneratorMixin, PdfGenerationCommand
+from core.scanning.worker_threads import WorkerThread
 from ui.question_editor import QuestionEditor
 from core.models.question_model import Question
 from i18n import translator, get_option_letter
@@ -12,18 +13,27 @@ from config.logger_config import get_logger, UI_LOGGER_NAME
 # Standard library
 import json
 from datetime import datetime
-from utils.files import build_timestamped_filename
+from utils.files import JsonExportCommand, build_timestamped_filename, write_json
 from utils.page_size import get_page_size_inches
 
 # PyQt6
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QTextCursor
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QListWidget, QTextEdit, QLabel,
-    QLineEdit, QPushButton, QDialog, QFileDialog
+    QLineEdit, QPushButton, QDialog, QFileDialog, QProgressDialog
 )
 
 # ReportLab (for page size constant)
 
+# Built-in defaults in every shipped language; forms still using them follow language changes
+_DEFAULT_TITLES: frozenset[str] = frozenset({"New Form", "Νέα Φόρμα"})
+_DEFAULT_INSTRUCTIONS: frozenset[str] = frozenset({
+    "Select the best answer for each question.",
+    "Επιλέξτε την καλύτερη απάντηση για κάθε ερώτηση.",
+})
+
+
 class FormDesigner(QWidget, PDFGeneratorMixin):
     """Form designer with all functionality"""
 
@@ -35,11 +45,27 @@ class FormDesigner(QWidget, PDFGeneratorMixin):
         self.form.title = translator.t('default_form_title')
         self.form.instructions = translator.t('default_instructions')
         self.log = get_logger(UI_LOGGER_NAME)
+        self._export_worker: WorkerThread | None = None  # At most one export runs at a time
+        self._export_progress: QProgressDialog | None = None
+        self._t_cache: dict[str, str] = {}  # Translations for the current language
+        self._preview_header = ""
+        self._preview_cache: list[str] | None = None  # Rendered preview text per question
+        self._pending_rows: set[int] = set()  # Rows edited since the last refresh (label + preview segment)
+        self._validation_cache: dict | None = None  # Last summary, valid until the form mutates
+        self._validation_form: Form | None = None
+        self._validation_dirty = True
+        self._validation_dialog: QDialog | None = None  # Built on first use, then reused
         self.setup_ui()
 
     def setup_ui(self) -> None:
         layout = QVBoxLayout()
 
+        # Coalesces keystroke-driven refreshes into one per idle window
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(AppConfig.REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self.refresh_display)
+
         # Form header
         info_layout = QHBoxLayout()
 
@@ -80,11 +106,16 @@ class FormDesigner(QWidget, PDFGeneratorMixin):
         self.splitter.addWidget(self.editor)
         self.splitter.addWidget(preview_widget)
         self.splitter.setSizes(AppConfig.SPLITTER_SIZES)
+        self.splitter.splitterMoved.connect(lambda *_: self._flush_preview())
 
         layout.addWidget(self.splitter)
         self.setLayout(layout)
         self.refresh_display()
 
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._flush_preview()
+
     def _create_questions_panel(self) -> QWidget:
         """Create questions list panel"""
         widget = QWidget()
@@ -119,13 +150,50 @@ class FormDesigner(QWidget, PDFGeneratorMixin):
 
         return widget
 
+    def _tr(self, key: str) -> str:
+        """Translate `key`, memoized per instance until the next language refresh."""
+        value = self._t_cache.get(key)
+        if value is None:
+            value = self._t_cache[key] = translator.t(key)
+        return value
+
+    def schedule_refresh(self) -> None:
+        """Refresh preview and validation once typing pauses."""
+        # Remember the row being edited; the refresh may run after the selection moved on
+        row = self.questions_list.currentRow()
+        if row >= 0:
+            self._pending_rows.add(row)
+        self._refresh_timer.start()
+
+    def mark_question_changed(self, question: Question) -> None:
+        """Queue the list label and preview segment of `question` for the next refresh."""
+        self.invalidate_validation()
+        for row, q in enumerate(self.form.questions):
+            if q is question:
+                self._pending_rows.add(row)
+                break
+
+    def invalidate_validation(self) -> None:
+        """Mark the cached validation summary stale after a form edit."""
+        self._validation_dirty = True
+
+    def _get_validation(self) -> dict:
+        """Return the form's validation summary, recomputing only after a change."""
+        if self._validation_dirty or self._validation_cache is None or self._validation_form is not self.form:
+            self._validation_cache = self.form.get_validation_summary()
+            self._validation_form = self.form
+            self._validation_dirty = False
+        return self._validation_cache
+
     def on_title_changed(self) -> None:
         self.form.title = self.title_input.text()
-        self.refresh_display()
+        self.invalidate_validation()
+        self.schedule_refresh()
 
     def on_instructions_changed(self) -> None:
         self.form.instructions = self.instructions_input.text()
-        self.refresh_display()
+        self.invalidate_validation()
+        self.schedule_refresh()
 
     def add_question(self) -> None:
         question = Question()
@@ -135,6 +203,8 @@ class FormDesigner(QWidget, PDFGeneratorMixin):
             translator.t('default_option_c'), translator.t('default_option_d')
         ]
         self.form.questions.append(question)
+        self._invalidate_preview()
+        self.invalidate_validation()
         self.update_question_list()
         self.questions_list.setCurrentRow(len(self.form.questions) - 1)
         self.refresh_display()
@@ -143,6 +213,8 @@ class FormDesigner(QWidget, PDFGeneratorMixin):
         row = self.questions_list.currentRow()
         if 0 <= row < len(self.form.questions):
             del self.form.questions[row]
+            self._invalidate_preview()
+            self.invalidate_validation()
             self.update_question_list()
             if self.form.questions:
                 self.questions_list.setCurrentRow(min(row, len(self.form.questions) - 1))
@@ -150,90 +222,174 @@ class FormDesigner(QWidget, PDFGeneratorMixin):
                 self.editor.clear()
             self.refresh_display()
 
+    def _question_at(self, row: int) -> Question | None:
+        return self.form.questions[row] if 0 <= row < len(self.form.questions) else None
+
     def on_question_selected(self, row: int) -> None:
-        if 0 <= row < len(self.form.questions):
-            self.editor.load_question(self.form.questions[row])
-        else:
-            self.editor.load_question(None)
+        question = self._question_at(row)
+        # Reselecting the question already in the editor needs no reload
+        if question is self.editor.question:
+            return
+        self.editor.load_question(question)
         self.refresh_display()
 
+    def _format_question_label(self, idx: int, q: Question) -> str:
+        """Questions-panel label: number, truncated text and points."""
+        text = q.text if q.text else self._tr('no_text')
+        limit = AppConfig.PREVIEW_TEXT_TRUNCATE_LENGTH
+        text = text[:limit] + "..." if len(text) > limit else text
+        prefix = self._tr('question_prefix_inline').format(idx + 1, text)
+        return f"{prefix} ({q.points}{self._tr('points_suffix')})"
+
     def update_question_list(self) -> None:
         current = self.questions_list.currentRow()
-        self.questions_list.clear()
-        for i, q in enumerate(self.form.questions):
-            text = q.text if q.text else translator.t('no_text')
-            limit = AppConfig.PREVIEW_TEXT_TRUNCATE_LENGTH
-            text = text[:limit] + "..." if len(text) > limit else text
-            prefix = translator.t('question_prefix_inline').format(i+1, text)
-            self.questions_list.addItem(f"{prefix} ({q.points}{translator.t('points_suffix')})")
-
-        if 0 <= current < len(self.form.questions):
-            self.questions_list.setCurrentRow(current)
+        # Update silently; item removal and re-selection would otherwise each reload the editor
+        self.questions_list.blockSignals(True)
+        try:
+            # Reuse existing items: grow or shrink to fit, then relabel only what changed
+            count = len(self.form.questions)
+            while self.questions_list.count() > count:
+                self.questions_list.takeItem(self.questions_list.count() - 1)
+            for i, q in enumerate(self.form.questions):
+                label = self._format_question_label(i, q)
+                item = self.questions_list.item(i)
+                if item is None:
+                    self.questions_list.addItem(label)
+                elif item.text() != label:
+                    item.setText(label)
+
+            if 0 <= current < count:
+                self.questions_list.setCurrentRow(current)
+        finally:
+            self.questions_list.blockSignals(False)
+
+        # Notify once, and only if the selection now points at a different question
+        row = self.questions_list.currentRow()
+        if self._question_at(row) is not self.editor.question:
+            self.questions_list.currentRowChanged.emit(row)
 
-    def _refresh_current_list_item(self) -> None:
-        """Update the currently selected list item label without rebuilding the list.
+    def _refresh_list_items(self, rows) -> None:
+        """Update the labels of the given list rows without rebuilding the list.
 
         Keeps the left questions panel in sync while editing the question
         text or points, avoiding signal loops from clearing/resetting the list.
         """
         try:
-            idx = self.questions_list.currentRow()
-            if idx < 0 or idx >= len(self.form.questions):
-                return
-            item = self.questions_list.item(idx)
-            if item is None:
-                return
-            q = self.form.questions[idx]
-            text = q.text if q.text else translator.t('no_text')
-            limit = AppConfig.PREVIEW_TEXT_TRUNCATE_LENGTH
-            text = text[:limit] + "..." if len(text) > limit else text
-            prefix = translator.t('question_prefix_inline').format(idx + 1, text)
-            item.setText(f"{prefix} ({q.points}{translator.t('points_suffix')})")
+            for idx in rows:
+                if idx < 0 or idx >= len(self.form.questions):
+                    continue
+                item = self.questions_list.item(idx)
+                if item is None:
+                    continue
+                label = self._format_question_label(idx, self.form.questions[idx])
+                if item.text() != label:
+                    item.setText(label)
         except Exception:
             # Non-fatal; UI update best-effort
             pass
 
-    def update_preview(self) -> None:
-        try:
-            text = f"{translator.t('preview_title')}: {self.form.title}\n{translator.t('preview_instructions')}: {self.form.instructions}\n\n"
-            for i, q in enumerate(self.form.questions):
-                text += translator.t('question_prefix').format(i+1, q.text)
-                non_empty_options = q.get_non_empty_options()
+    def _render_preview_header(self) -> str:
+        return f"{self._tr('preview_title')}: {self.form.title}\n{self._tr('preview_instructions')}: {self.form.instructions}\n\n"
 
-                # Get the correct answer text (handle empty options)
-                correct_option = ""
-                if q.correct < len(q.options) and q.options[q.correct].strip():
-                    correct_option = q.options[q.correct].strip()
+    def _render_preview_question(self, i: int, q: Question) -> str:
+        parts = [self._tr('question_prefix').format(i+1, q.text)]
+        non_empty_options = q.get_non_empty_options()
 
-                for j, opt in enumerate(non_empty_options):
-                    marker = "*" if opt == correct_option else " "
-                    text += f"  {marker} {get_option_letter(j)}. {opt}\n"
-                text += f"  {translator.t('preview_points')}: {q.points}\n\n"
+        # Get the correct answer text (handle empty options)
+        correct_option = ""
+        if q.correct < len(q.options) and q.options[q.correct].strip():
+            correct_option = q.options[q.correct].strip()
 
+        for j, opt in enumerate(non_empty_options):
+            marker = "*" if opt == correct_option else " "
+            parts.append(f"  {marker} {get_option_letter(j)}. {opt}\n")
+        parts.append(f"  {self._tr('preview_points')}: {q.points}\n\n")
+        return "".join(parts)
+
+    def _invalidate_preview(self) -> None:
+        """Force the next refresh to rebuild the preview from scratch."""
+        self._preview_cache = None
+
+    def _preview_visible(self) -> bool:
+        return self.preview.isVisible() and self.preview.width() > 1
+
+    def _flush_preview(self) -> None:
+        """Render the preview if it was skipped while hidden or collapsed."""
+        if self._preview_cache is None and self._preview_visible():
+            self.update_preview()
+
+    def update_preview(self) -> None:
+        """Rebuild the whole preview text and its per-question segment cache."""
+        # Nothing to draw for a hidden or collapsed pane; rebuild once it is shown again
+        if not self._preview_visible():
+            self._invalidate_preview()
+            return
+        try:
+            self._preview_header = self._render_preview_header()
+            self._preview_cache = [self._render_preview_question(i, q) for i, q in enumerate(self.form.questions)]
             if hasattr(self, 'preview') and self.preview:
-                self.preview.setPlainText(text)
+                self.preview.setPlainText(self._preview_header + "".join(self._preview_cache))
             else:
                 self.log.debug("Preview widget not found")
         except Exception as e:
             self.log.exception("Error in update_preview: %s", e)
 
+    def _refresh_preview_items(self, rows) -> bool:
+        """Patch the header and the given questions in the preview without rebuilding it.
+
+        Returns False when the segment cache no longer matches the form
+        (questions added, removed or reloaded) and a full rebuild is needed.
+        """
+        if self._preview_cache is None or len(self._preview_cache) != len(self.form.questions):
+            return False
+        try:
+            header = self._render_preview_header()
+            if header != self._preview_header:
+                self._replace_preview_segment(-1, self._preview_header, header)
+                self._preview_header = header
+            for idx in sorted(rows):
+                if 0 <= idx < len(self.form.questions):
+                    text = self._render_preview_question(idx, self.form.questions[idx])
+                    if text != self._preview_cache[idx]:
+                        self._replace_preview_segment(idx, self._preview_cache[idx], text)
+                        self._preview_cache[idx] = text
+            return True
+        except Exception as e:
+            self.log.exception("Error in _refresh_preview_items: %s", e)
+            return False
+
+    def _replace_preview_segment(self, idx: int, old: str, new: str) -> None:
+        """Swap one cached segment (-1 for the header) in the preview document."""
+        # QTextDocument positions count UTF-16 code units
+        qlen = lambda t: len(t.encode('utf-16-le')) // 2
+        start = 0 if idx < 0 else qlen(self._preview_header) + sum(qlen(t) for t in self._preview_cache[:idx])
+        cursor = QTextCursor(self.preview.document())
+        cursor.setPosition(start)
+        cursor.setPosition(start + qlen(old), QTextCursor.MoveMode.KeepAnchor)
+        cursor.insertText(new)
+
     def update_validation(self) -> None:
-        summary = self.form.get_validation_summary()
+        summary = self._get_validation()
         self.validation_changed.emit(summary)
 
     def refresh_display(self) -> None:
         """Update preview and validation"""
-        # Keep questions list label in sync while typing
-        self._refresh_current_list_item()
-        self.update_preview()
+        # A direct refresh supersedes any pending debounced one, so it also covers
+        # the rows that refresh was scheduled for (the selection may have moved since)
+        self._refresh_timer.stop()
+        rows = self._pending_rows | {self.questions_list.currentRow()}
+        self._pending_rows = set()
+        # Keep questions list labels in sync while typing
+        self._refresh_list_items(rows)
+        if not self._preview_visible():
+            self._invalidate_preview()
+        elif not self._refresh_preview_items(rows):
+            self.update_preview()
         self.update_validation()
 
-    def show_validation_details(self) -> None:
-        """Show detailed validation dialog"""
-        summary = self.form.get_validation_summary()
-
+    def _build_validation_dialog(self) -> QDialog:
+        """Create the validation dialog once; its contents are refreshed per call."""
         dialog = QDialog(self)
-        dialog.setWindowTitle(translator.t('validation_title'))
         dialog.setMinimumSize(450, 250)
 
         layout = QVBoxLayout()
@@ -241,57 +397,77 @@ class FormDesigner(QWidget, PDFGeneratorMixin):
         # Header with icon and message
         header_layout = QHBoxLayout()
 
-        icon_label = QLabel()
+        self._validation_icon = QLabel()
+        self._validation_icon.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self._validation_icon.setFixedSize(30, 30)
+        header_layout.addWidget(self._validation_icon)
+
+        self._validation_msg = QLabel()
+        self._validation_msg.setWordWrap(True)
+        self._validation_msg.setAlignment(Qt.AlignmentFlag.AlignTop)
+        header_layout.addWidget(self._validation_msg)
+
+        layout.addLayout(header_layout)
+
+        # Details (only shown when there are errors)
+        self._validation_details_label = QLabel()
+        self._validation_details_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        layout.addWidget(self._validation_details_label)
+
+        self._validation_details_text = QTextEdit()
+        self._validation_details_text.setReadOnly(True)
+        layout.addWidget(self._validation_details_text)
+
+        # OK button
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self._validation_ok = QPushButton()
+        self._validation_ok.clicked.connect(dialog.accept)
+        self._validation_ok.setDefault(True)
+        button_layout.addWidget(self._validation_ok)
+        layout.addLayout(button_layout)
+
+        dialog.setLayout(layout)
+        return dialog
+
+    def show_validation_details(self) -> None:
+        """Show detailed validation dialog"""
+        summary = self._get_validation()
+
+        if self._validation_dialog is None:
+            self._validation_dialog = self._build_validation_dialog()
+        dialog = self._validation_dialog
+        dialog.setWindowTitle(self._tr('validation_title'))
+        self._validation_ok.setText(self._tr('ok_button'))
+
         if summary["status"] == "valid":
-            icon_label.setText("ℹ️")
+            self._validation_icon.setText("ℹ️")
         elif summary["status"] == "warning":
-            icon_label.setText("⚠️")
+            self._validation_icon.setText("⚠️")
         else:
-            icon_label.setText("❌")
-        icon_label.setAlignment(Qt.AlignmentFlag.AlignTop)
-        icon_label.setFixedSize(30, 30)
-        header_layout.addWidget(icon_label)
+            self._validation_icon.setText("❌")
 
-        message_label = QLabel()
         if summary["status"] == "valid":
-            message_label.setText(translator.t('form_valid'))
+            self._validation_msg.setText(self._tr('form_valid'))
         else:
-            message_label.setText(summary["message"])
-        message_label.setWordWrap(True)
-        message_label.setAlignment(Qt.AlignmentFlag.AlignTop)
-        header_layout.addWidget(message_label)
-
-        layout.addLayout(header_layout)
+            self._validation_msg.setText(summary["message"])
 
         # Details if there are errors
-        if summary["status"] != "valid" and summary["errors"]:
-            details_label = QLabel(translator.t('details_label'))
-            details_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
-            layout.addWidget(details_label)
-
-            details_text = QTextEdit()
+        show_details = summary["status"] != "valid" and bool(summary["errors"])
+        self._validation_details_label.setVisible(show_details)
+        self._validation_details_text.setVisible(show_details)
+        if show_details:
+            self._validation_details_label.setText(self._tr('details_label'))
             error_text = "\n".join([f"• {e}" for e in summary["errors"]])
-            details_text.setPlainText(error_text)
-            details_text.setReadOnly(True)
+            self._validation_details_text.setPlainText(error_text)
 
             # Dynamic height calculation
-            doc = details_text.document()
+            doc = self._validation_details_text.document()
             doc.setTextWidth(450)
             content_height = int(doc.size().height())
             optimal_height = max(60, min(content_height + 20, 300))
-            details_text.setFixedHeight(optimal_height)
-            layout.addWidget(details_text)
+            self._validation_details_text.setFixedHeight(optimal_height)
 
-        # OK button
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
-        ok_button = QPushButton(translator.t('ok_button'))
-        ok_button.clicked.connect(dialog.accept)
-        ok_button.setDefault(True)
-        button_layout.addWidget(ok_button)
-        layout.addLayout(button_layout)
-
-        dialog.setLayout(layout)
         dialog.adjustSize()
 
         # Size constraints
@@ -305,11 +481,11 @@ class FormDesigner(QWidget, PDFGeneratorMixin):
 
     # File operations
     def save_form(self) -> None:
+        self.editor.flush_pending_edits()
         filename, _ = QFileDialog.getSaveFileName(self, translator.t('save_form_dialog'), "", translator.t('file_filter_json'))
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.form.to_dict(), f, indent=2, ensure_ascii=False)
+                write_json(filename, self.form.to_dict())
                 self.log.info("Form saved: %s", filename)
                 ErrorHandler.show_info(self, translator.t('success'), translator.t('form_saved'))
             except Exception as e:
@@ -322,6 +498,8 @@ class FormDesigner(QWidget, PDFGeneratorMixin):
                 with open(filename, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                 self.form = Form.from_dict(data)
+                self._invalidate_preview()
+                self.invalidate_validation()
                 self.title_input.setText(self.form.title)
                 self.instructions_input.setText(self.form.instructions)
                 self.update_question_list()
@@ -339,6 +517,8 @@ class FormDesigner(QWidget, PDFGeneratorMixin):
             if dialog.clear_existing_cb.isChecked():
                 self.form.questions.clear()
             self.form.questions.extend(dialog.imported_questions)
+            self._invalidate_preview()
+            self.invalidate_validation()
             self.update_question_list()
             if self.form.questions:
                 self.questions_list.setCurrentRow(len(self.form.questions) - 1)
@@ -353,13 +533,7 @@ class FormDesigner(QWidget, PDFGeneratorMixin):
         filename, _ = QFileDialog.getSaveFileName(self, translator.t('menu_export_pdf'),
                                                 build_timestamped_filename(self.form.title, 'pdf'), translator.t('file_filter_pdf'))
         if filename:
-            try:
-                self._generate_pdf(filename)
-                self.log.info("PDF exported: %s", filename)
-                ErrorHandler.show_info(self, translator.t('success'), translator.t('pdf_exported'))
-            except Exception as e:
-                self.log.exception("PDF export failed for '%s': %s", filename, e)
-                self._handle_file_error(e, 'export_failed')
+            self._start_export(PdfGenerationCommand(self.form, filename, 'pdf'), translator.t('pdf_exported'))
 
     def export_omr_sheet(self) -> None:
         if not self._check_export():
@@ -367,15 +541,57 @@ class FormDesigner(QWidget, PDFGeneratorMixin):
         filename, _ = QFileDialog.getSaveFileName(self, translator.t('menu_export_omr'),
                                                 build_timestamped_filename(f"{self.form.title}_sheet", 'pdf'), translator.t('file_filter_pdf'))
         if filename:
-            try:
-                self._generate_omr_sheet(filename)
-                self.log.info("OMR sheet exported: %s", filename)
-                ErrorHandler.show_info(self, translator.t('success'), translator.t('omr_exported'))
-            except Exception as e:
-                self.log.exception("OMR export failed for '%s': %s", filename, e)
-                self._handle_file_error(e, 'export_failed')
+            self._start_export(PdfGenerationCommand(self.form, filename, 'omr_sheet'), translator.t('omr_exported'))
+
+    def _start_export(self, command, success_message: str) -> None:
+        """Run an export command on a worker thread, one at a time, with a busy indicator."""
+        if self._export_worker is not None:
+            ErrorHandler.show_warning(self, translator.t('warning'), translator.t('export_in_progress'))
+            return
+        self._export_progress = QProgressDialog(translator.t('export_in_progress'), None, 0, 0, self)
+        self._export_progress.setWindowModality(Qt.WindowModality.NonModal)
+        self._export_progress.setMinimumDuration(0)
+        self._export_progress.show()
+
+        worker = WorkerThread(command)
+        worker.result_ready.connect(lambda result: self._on_export_done(result, success_message))
+        worker.finished.connect(self._on_export_finished)
+        self._export_worker = worker
+        worker.start()
+
+    def _on_export_finished(self) -> None:
+        worker, self._export_worker = self._export_worker, None
+        if worker is not None:
+            # run() has returned; join the thread before releasing it, then let Qt delete it
+            worker.wait()
+            worker.deleteLater()
+        if self._export_progress is not None:
+            self._export_progress.close()
+            self._export_progress = None
+
+    def stop_workers(self) -> None:
+        """Wait for a running export before the window goes away, without reporting its result."""
+        worker, self._export_worker = self._export_worker, None
+        if worker is None:
+            return
+        worker.result_ready.disconnect()
+        worker.finished.disconnect()
+        worker.wait()
+        if self._export_progress is not None:
+            self._export_progress.close()
+            self._export_progress = None
+
+    def _on_export_done(self, result: dict, success_message: str) -> None:
+        if result.get('success'):
+            self.log.info("%s exported: %s", result.get('kind'), result.get('filename'))
+            ErrorHandler.show_info(self, translator.t('success'), success_message)
+        else:
+            self.log.error("%s export failed for '%s'", result.get('kind'), result.get('filename'))
+            error = result.get('error') or RuntimeError(result.get('message', ''))
+            self._handle_file_error(error, 'export_failed')
 
     def export_for_scanner(self) -> None:
+        self.editor.flush_pending_edits()
         if not self.form.questions:
             ErrorHandler.show_warning(self, translator.t('warning'), translator.t('no_questions_export'))
             return
@@ -383,7 +599,10 @@ class FormDesigner(QWidget, PDFGeneratorMixin):
                                                   build_timestamped_filename(self.form.title.replace(' ', '_'), 'omr'), translator.t('file_filter_omr'))
         if filename:
             try:
-                bubble_coordinates = self._calculate_bubble_coordinates()
+                page_size_inches = get_page_size_inches()
+                alignment_points = self._calculate_alignment_points(page_size_inches)
+                bubble_coordinates = self._calculate_bubble_coordinates(alignment_points)
+                correct_indices = [q.get_adjusted_correct_index() for q in self.form.questions]
                 data = {
                     "format_version": AppConfig.EXPORT_FORMAT_VERSION,
                     "generator": AppConfig.APP_GENERATOR,
@@ -398,74 +617,74 @@ class FormDesigner(QWidget, PDFGeneratorMixin):
                         "page_size": (AppConfig.DEFAULT_PAGE_SIZE.value if hasattr(AppConfig.DEFAULT_PAGE_SIZE, "value") else str(AppConfig.DEFAULT_PAGE_SIZE)),
                         "orientation": (AppConfig.DEFAULT_PAGE_ORIENTATION.value if hasattr(AppConfig.DEFAULT_PAGE_ORIENTATION, "value") else str(AppConfig.DEFAULT_PAGE_ORIENTATION)),
                         "bubble_style": "circle",
-                        "page_width_inches": get_page_size_inches()[0],
-                        "page_height_inches": get_page_size_inches()[1],
+                        "page_width_inches": page_size_inches[0],
+                        "page_height_inches": page_size_inches[1],
                         "dpi": AppConfig.EXPORT_DPI
                     },
                     "questions": [{"id": i+1, "text": q.text, "options": q.get_non_empty_options(),
-                                     "correct_answer": q.get_adjusted_correct_index(), "points": q.points}
-                                    for i, q in enumerate(self.form.questions)],
-                    "answer_key": {str(i+1): q.get_adjusted_correct_index() for i, q in enumerate(self.form.questions)},
+                                     "correct_answer": correct, "points": q.points}
+                                    for i, (q, correct) in enumerate(zip(self.form.questions, correct_indices))],
+                    "answer_key": {str(i+1): correct for i, correct in enumerate(correct_indices)},
                     "bubble_coordinates": bubble_coordinates,
-                    "alignment_points": self._calculate_alignment_points(),
+                    "alignment_points": alignment_points,
                     "grading_config": {
                         "scoring_method": "points",
                         "penalty_wrong": AppConfig.PENALTY_WRONG,
                         "penalty_blank": AppConfig.PENALTY_BLANK
                     }
                 }
-
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                self.log.info("Scanner export saved: %s", filename)
-                ErrorHandler.show_info(self, translator.t('success'),
-                                       f"{translator.t('exported_scanner')} {filename}")
             except Exception as e:
                 self.log.exception("Scanner export failed for '%s': %s", filename, e)
                 ErrorHandler.show_error(self, translator.t('error'),
                                         f"{translator.t('export_failed')} {str(e)}")
+                return
+            # Building the payload is cheap; writing it out happens off the UI thread
+            self._start_export(JsonExportCommand(data, filename, 'scanner'),
+                               f"{translator.t('exported_scanner')} {filename}")
 
-    def _calculate_bubble_coordinates(self):
+    def _calculate_bubble_coordinates(self, alignment: dict | None = None):
         """Calculate exact bubble coordinates for scanner"""
-        alignment = self._calculate_alignment_points()
+        if alignment is None:
+            alignment = self._calculate_alignment_points()
         top_left_anchor = alignment["top_left"]
+        anchor_x, anchor_y = top_left_anchor["x"], top_left_anchor["y"]
 
         # Layout parameters for exported scanner coordinates
         anchor_to_first_bubble_x = AppConfig.EXPORT_ANCHOR_TO_FIRST_BUBBLE_X
         anchor_to_first_bubble_y = AppConfig.EXPORT_ANCHOR_TO_FIRST_BUBBLE_Y
         bubble_spacing_x = AppConfig.EXPORT_BUBBLE_SPACING_X
         bubble_spacing_y = AppConfig.EXPORT_BUBBLE_SPACING_Y
+        radius_px = int((AppConfig.BUBBLE_RADIUS / AppConfig.POINTS_PER_INCH) * AppConfig.EXPORT_DPI)
+
+        # Column positions and letters depend only on the option index
+        option_counts = [question.get_option_count() for question in self.form.questions]
+        columns = [(get_option_letter(j), anchor_to_first_bubble_x + (j * bubble_spacing_x))
+                   for j in range(max(option_counts, default=0))]
 
         bubble_coordinates = {}
-        for i, question in enumerate(self.form.questions):
-            question_num = i + 1
-            bubble_coordinates[question_num] = {}
+        for i, option_count in enumerate(option_counts):
+            # Row position depends only on the question index
+            relative_y = anchor_to_first_bubble_y + (i * bubble_spacing_y)
+            absolute_y = anchor_y + relative_y
 
             # Only create coordinates for non-empty options
-            option_count = question.get_option_count()
-            for j in range(option_count):
-                option_letter = get_option_letter(j)
-
-                relative_x = anchor_to_first_bubble_x + (j * bubble_spacing_x)
-                relative_y = anchor_to_first_bubble_y + (i * bubble_spacing_y)
-
-                absolute_x = top_left_anchor["x"] + relative_x
-                absolute_y = top_left_anchor["y"] + relative_y
-
-                bubble_coordinates[question_num][option_letter] = {
-                    "x": absolute_x, "y": absolute_y,
-                    "radius": int((AppConfig.BUBBLE_RADIUS / AppConfig.POINTS_PER_INCH) * AppConfig.EXPORT_DPI),
+            bubble_coordinates[i + 1] = {
+                option_letter: {
+                    "x": anchor_x + relative_x, "y": absolute_y,
+                    "radius": radius_px,
                     "relative_to_anchor": {"x": relative_x, "y": relative_y, "anchor": "top_left"}
                 }
+                for option_letter, relative_x in columns[:option_count]
+            }
 
         return bubble_coordinates
 
-    def _calculate_alignment_points(self):
+    def _calculate_alignment_points(self, page_size_inches: tuple[float, float] | None = None):
         """Calculate alignment point coordinates"""
         dpi = AppConfig.EXPORT_DPI
         points_per_inch = AppConfig.POINTS_PER_INCH
         # Compute from configured page size in inches
-        width_in, height_in = get_page_size_inches()
+        width_in, height_in = page_size_inches or get_page_size_inches()
         page_width_px = int(width_in * dpi)
         page_height_px = int(height_in * dpi)
         square_size_px = int((AppConfig.PDF_ALIGNMENT_SQUARE_SIZE / points_per_inch) * dpi)
@@ -480,7 +699,9 @@ class FormDesigner(QWidget, PDFGeneratorMixin):
         }
 
     def _check_export(self) -> bool:
-        summary = self.form.get_validation_summary()
+        # Validate and export what the editor shows, including keystrokes still being debounced
+        self.editor.flush_pending_edits()
+        summary = self._get_validation()
         if summary["status"] == "invalid":
             ErrorHandler.show_error(self, translator.t('error'), translator.t('critical_errors'))
             return False
@@ -488,32 +709,32 @@ class FormDesigner(QWidget, PDFGeneratorMixin):
 
     def _handle_file_error(self, error: Exception, operation_key: str) -> None:
         """Handle file operation errors"""
-        msg = f"{translator.t(operation_key)} "
         if isinstance(error, PermissionError):
-            msg += translator.t('file_permission_denied')
+            detail = translator.t('file_permission_denied')
+        elif isinstance(error, FileNotFoundError):
+            detail = translator.t('file_not_found')
         elif isinstance(error, OSError):
-            msg += translator.t('file_disk_error').format(str(error))
+            detail = translator.t('file_disk_error').format(str(error))
         elif isinstance(error, json.JSONDecodeError):
-            msg += translator.t('file_invalid_json').format(str(error))
-        elif isinstance(error, FileNotFoundError):
-            msg += translator.t('file_not_found')
+            detail = translator.t('file_invalid_json').format(str(error))
         else:
-            msg += str(error)
+            detail = str(error)
         self.log.error("File operation '%s' failed: %s", operation_key, error)
-        ErrorHandler.show_error(self, translator.t('error'), msg)
+        ErrorHandler.show_error(self, translator.t('error'), " ".join((translator.t(operation_key), detail)))
 
     def refresh_ui(self) -> None:
         """Refresh UI for language changes"""
-        # Update form defaults if they match translated defaults
-        default_titles = ["New Form", "Νέα Φόρμα"]
-        default_instructions = ["Select the best answer for each question.",
-                               "Επιλέξτε την καλύτερη απάντηση για κάθε ερώτηση."]
+        # Drop memoized translations; if none of them changed, the list and preview are already current
+        previous = self._t_cache
+        self._t_cache = {}
+        texts_changed = not previous or any(self._tr(key) != text for key, text in previous.items())
 
-        if self.form.title in default_titles:
+        # Update form defaults if they match translated defaults
+        if self.form.title in _DEFAULT_TITLES:
             self.form.title = translator.t('default_form_title')
             self.title_input.setText(self.form.title)
 
-        if self.form.instructions in default_instructions:
+        if self.form.instructions in _DEFAULT_INSTRUCTIONS:
             self.form.instructions = translator.t('default_instructions')
             self.instructions_input.setText(self.form.instructions)
 
@@ -532,5 +753,7 @@ class FormDesigner(QWidget, PDFGeneratorMixin):
         if hasattr(self, 'editor'):
             self.editor.refresh_option_letters()
 
-        self.update_question_list()
-        self.refresh_display()
+        if texts_changed:
+            self._invalidate_preview()
+            self.update_question_list()
+            self.refresh_display()
@@ -1,25 +1,81 @@
-import json
+import string
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from utils.files import build_timestamped_filename
+from utils.files import JsonLoadCommand, build_timestamped_filename
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox, QPushButton,
-    QLineEdit, QTextEdit, QTableWidget, QTableWidgetItem, QFileDialog, QSizePolicy
+    QLineEdit, QTextEdit, QTableView, QFileDialog, QSizePolicy
 )
 
 from core.pdf.report_generator import generate_class_report
+from core.scanning.worker_threads import WorkerThread
 
 from core.grading.grading_core import EXCEL_AVAILABLE
 from utils.error_handling import ErrorHandler
 from core.grading.grading_core import GradeResult, GradingSystem
-from ui.table_manager import TableManager
+from ui.table_manager import GradeResultsModel, TableManager
 from i18n import translator, get_option_letter
 from config.logger_config import get_logger, GRADING_LOGGER_NAME
 from config.app_config import AppConfig
 
+
+@lru_cache(maxsize=512)
+def _tt(key: str, lang: str) -> str:
+    """Translate `key`, memoized per language; `lang` only keys the cache."""
+    return translator.t(key)
+
+
+def _field(key: str, lang: str, name: str = '') -> str:
+    """Return a translation as a str.format fragment.
+
+    Literal braces are escaped and the translation's own placeholder (if
+    any) is renamed to `name`, so several translations can share one
+    template with named fields.
+    """
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(_tt(key, lang)):
+        parts.append(literal.replace('{', '{{').replace('}', '}}'))
+        if field is not None:
+            parts.append('{' + name + (f'!{conversion}' if conversion else '') + (f':{spec}' if spec else '') + '}')
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=8)
+def _grade_template(lang: str) -> str:
+    """Grade sheet text for `lang`; only the per-student values are filled in per call."""
+    return f"""📊 {_field('grade_sheet', lang)}
+
+{_field('student_name_field', lang)} {{student_name}}
+{_field('student_id_field', lang)} {{student_id}}
+
+{_field('score_label', lang)} {{score}}/{{total_possible}}
+{_field('percentage_label', lang)} {{percentage:.1f}}%
+{_field('grade_label', lang)} {{letter_grade}}
+
+{_field('statistics_title', lang)}:
+{_field('correct_answers', lang, 'correct_count')}
+{_field('incorrect_answers', lang, 'incorrect_count')}
+{_field('blank_answers', lang, 'blank_count')}
+"""
+
+
+@lru_cache(maxsize=8)
+def _stats_template(lang: str) -> str:
+    """Class statistics text for `lang`; only the figures are filled in per call."""
+    return f"""{_field('class_statistics', lang)}
+
+{_field('students_processed', lang, 'count')}
+{_field('average_score', lang, 'average')}
+{_field('highest_score', lang, 'highest')}
+{_field('lowest_score', lang, 'lowest')}
+{_field('pass_rate', lang, 'pass_rate')}
+"""
+
+
 class GradingWidget(QWidget):
     """Dedicated Grading & Reports tab with batch processing"""
 
@@ -31,6 +87,12 @@ class GradingWidget(QWidget):
         self.grading_system = GradingSystem()
         self.current_grade_result = None
         self.scan_results = {}
+        self._lang = translator.current_lang()  # Language the translation cache was filled for
+        # Answer key derived from the loaded scan, shared by every student graded against it
+        self._answer_key_int: dict[int, str] = {}
+        self._points_per_question: dict[int, int] = {}
+        self._answer_key_lang: str | None = None  # Option letters are language dependent
+        self._load_worker: WorkerThread | None = None  # Scan results file being parsed
         self.setup_ui()
 
     def setup_ui(self) -> None:
@@ -188,11 +250,13 @@ class GradingWidget(QWidget):
         self.students_group = QGroupBox(translator.t('students_processed_title'))
         students_layout = QVBoxLayout(self.students_group)
 
-        self.students_table = QTableWidget()
+        # Rows are read from the grading system on demand
+        self.students_table = QTableView()
+        self.students_model = GradeResultsModel(self.grading_system, self.students_table)
+        self.students_table.setModel(self.students_model)
 
         # Use centralized table configuration
         TableManager.configure_students_table(self.students_table)
-        self._update_table_headers()
 
         students_layout.addWidget(self.students_table)
 
@@ -204,40 +268,85 @@ class GradingWidget(QWidget):
 
     def _update_table_headers(self) -> None:
         """Update table headers with current translations"""
-        headers = TableManager.get_translated_headers()
-        self.students_table.setHorizontalHeaderLabels(headers)
+        self.students_model.set_headers(TableManager.get_translated_headers())
 
     def load_scan_results(self) -> None:
         """Load scan results from Scanner tab or file"""
         # First try to get current scan results from Scanner tab
-        scanner_tab = self.parent_app.scanner_tab
-        if scanner_tab.answers and scanner_tab.omr_data:
+        scanner_tab = self.parent_app.scanner_tab  # None until the Scanner tab is first opened
+        if scanner_tab is not None and scanner_tab.answers and scanner_tab.omr_data:
             self.scan_results = {
                 'answers': scanner_tab.answers.copy(),
                 'omr_data': scanner_tab.omr_data.copy()
             }
+            self._build_answer_key()
             self.scan_info.setText(translator.t('loaded_from_scanner_tab'))
             self.calculate_grade_btn.setEnabled(True)
             return
 
         # Otherwise, load from file (for future batch processing)
         file_path, _ = QFileDialog.getOpenFileName(
-            self, translator.t('load_scan_results'), "",
+            self, translator.t('load_scan_results'), AppConfig.last_import_dir,
             translator.t('file_filter_omr_json')
         )
 
-        if file_path:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    self.scan_results = json.load(f)
-
-                filename = Path(file_path).name
-                self.scan_info.setText(f"✅ {filename}")
-                self.calculate_grade_btn.setEnabled(True)
-                self.log.info("Loaded scan results file: %s", file_path)
-
-            except Exception as e:
-                ErrorHandler.show_error(self, translator.t('error'), translator.t('load_results_failed').format(str(e)))
+        if file_path and self._load_worker is None:
+            AppConfig.last_import_dir = str(Path(file_path).parent)
+            # Parse off the UI thread; the button stays disabled until the load finishes
+            self.load_results_btn.setEnabled(False)
+            worker = WorkerThread(JsonLoadCommand(file_path))
+            worker.result_ready.connect(self._on_scan_results_loaded)
+            worker.finished.connect(self._on_load_finished)
+            self._load_worker = worker
+            worker.start()
+
+    def _on_load_finished(self) -> None:
+        worker, self._load_worker = self._load_worker, None
+        if worker is not None:
+            # run() has returned; join the thread before releasing it, then let Qt delete it
+            worker.wait()
+            worker.deleteLater()
+        self.load_results_btn.setEnabled(True)
+
+    def stop_workers(self) -> None:
+        """Wait for a running results load before the widget goes away, discarding its result."""
+        worker, self._load_worker = self._load_worker, None
+        if worker is None:
+            return
+        worker.result_ready.disconnect()
+        worker.finished.disconnect()
+        worker.wait()
+
+    def _on_scan_results_loaded(self, result: dict) -> None:
+        try:
+            if not result.get('success'):
+                raise RuntimeError(result.get('message', ''))
+            self.scan_results = result['data']
+            self._build_answer_key()
+
+            file_path = result['filename']
+            self.scan_info.setText(f"✅ {Path(file_path).name}")
+            self.calculate_grade_btn.setEnabled(True)
+            self.log.info("Loaded scan results file: %s", file_path)
+
+        except Exception as e:
+            ErrorHandler.show_error(self, translator.t('error'), translator.t('load_results_failed').format(str(e)))
+
+    def _build_answer_key(self) -> None:
+        """Derive the answer key and points from the loaded scan results once per load"""
+        questions_data = self.scan_results.get('omr_data', {}).get('questions', [])
+        # The current language's letters, indexed directly; get_option_letter covers out-of-range indices
+        letters = translator.option_letters
+        answer_key: dict[int, str] = {}
+        points: dict[int, int] = {}
+        for q_num, question_data in enumerate(questions_data, 1):
+            correct_index = question_data.get('correct_answer', 0)
+            answer_key[q_num] = (letters[correct_index] if 0 <= correct_index < len(letters)
+                                 else get_option_letter(correct_index))
+            points[q_num] = question_data.get('points', 1)
+        self._answer_key_int = answer_key
+        self._points_per_question = points
+        self._answer_key_lang = translator.current_lang()
 
     def calculate_grade(self) -> None:
         """Calculate and display grade for current student"""
@@ -254,23 +363,12 @@ class GradingWidget(QWidget):
 
         # Extract data from scan results
         answers = self.scan_results.get('answers', {})
-        omr_data = self.scan_results.get('omr_data', {})
-
-        # Extract answer key and points
-        questions_data = omr_data.get('questions', [])
-        answer_key_int = {}
-        points_per_question = {}
-
-        for i, question_data in enumerate(questions_data):
-            q_num = i + 1
-            # Convert correct answer index to letter
-            correct_index = question_data.get('correct_answer', 0)
-            answer_key_int[q_num] = get_option_letter(correct_index)
-            points_per_question[q_num] = question_data.get('points', 1)
+        if self._answer_key_lang != translator.current_lang():
+            self._build_answer_key()
 
         # Calculate grade
         self.current_grade_result = self.grading_system.calculate_grade(
-            student_name, student_id, answers, answer_key_int, points_per_question
+            student_name, student_id, answers, self._answer_key_int, self._points_per_question
         )
 
         # Display results
@@ -279,32 +377,28 @@ class GradingWidget(QWidget):
         # Enable additional controls
         self.add_student_btn.setEnabled(True)
         self.update_class_statistics()
-        self.update_students_table()
+        self._append_student_row()
         self.enable_export_controls()
 
     def display_grade_result(self, result: GradeResult) -> None:
         """Display grade result in the grade display area"""
-        text = f"""📊 {translator.t('grade_sheet')}
-
-{translator.t('student_name_field')} {result.student_name}
-{translator.t('student_id_field')} {result.student_id}
-
-{translator.t('score_label')} {result.score}/{result.total_possible}
-{translator.t('percentage_label')} {result.percentage:.1f}%
-{translator.t('grade_label')} {self.grading_system.get_letter_grade(result.percentage)}
-
-{translator.t('statistics_title')}:
-{translator.t('correct_answers').format(result.correct_count)}
-{translator.t('incorrect_answers').format(result.incorrect_count)}
-{translator.t('blank_answers').format(result.blank_count)}
-"""
+        text = _grade_template(translator.current_lang()).format(
+            student_name=result.student_name,
+            student_id=result.student_id,
+            score=result.score,
+            total_possible=result.total_possible,
+            percentage=result.percentage,
+            letter_grade=result.letter_grade,
+            correct_count=result.correct_count,
+            incorrect_count=result.incorrect_count,
+            blank_count=result.blank_count,
+        )
         self.grade_display.setText(text)
 
     def add_current_student(self) -> None:
         """Add current student to batch processing list"""
         if self.current_grade_result:
-            self.update_students_table()
-            self.update_class_statistics()
+            # The row and statistics were updated when the grade was calculated
             self.enable_export_controls()
 
             # Clear current student fields for next entry
@@ -316,28 +410,19 @@ class GradingWidget(QWidget):
 
     def remove_selected_student(self) -> None:
         """Remove selected student from the list"""
-        current_row = self.students_table.currentRow()
+        current_row = self.students_table.currentIndex().row()
         if current_row >= 0 and current_row < len(self.grading_system.results):
-            self.grading_system.results.pop(current_row)
-            self.update_students_table()
+            self.students_model.remove_row(current_row)
+            self.remove_student_btn.setEnabled(len(self.grading_system.results) > 0)
             self.update_class_statistics()
 
             if not self.grading_system.results:
                 self.disable_export_controls()
 
-    def update_students_table(self) -> None:
-        """Update the students table with current results"""
-        self.students_table.setRowCount(len(self.grading_system.results))
-
-        for row, result in enumerate(self.grading_system.results):
-            self.students_table.setItem(row, 0, QTableWidgetItem(result.student_name))
-            self.students_table.setItem(row, 1, QTableWidgetItem(result.student_id))
-            self.students_table.setItem(row, 2, QTableWidgetItem(str(result.score)))
-            self.students_table.setItem(row, 3, QTableWidgetItem(str(result.total_possible)))
-            self.students_table.setItem(row, 4, QTableWidgetItem(f"{result.percentage:.1f}%"))
-            self.students_table.setItem(row, 5, QTableWidgetItem(self.grading_system.get_letter_grade(result.percentage)))
-
-        self.remove_student_btn.setEnabled(len(self.grading_system.results) > 0)
+    def _append_student_row(self) -> None:
+        """Show the newest result as one inserted row instead of rebuilding the table"""
+        self.students_model.sync()
+        self.remove_student_btn.setEnabled(True)
 
     def update_class_statistics(self) -> None:
         """Update class statistics display"""
@@ -345,16 +430,7 @@ class GradingWidget(QWidget):
             self.stats_display.clear()
             return
 
-        stats = self.grading_system.compute_stats()
-
-        stats_text = f"""{translator.t('class_statistics')}
-
-{translator.t('students_processed').format(len(self.grading_system.results))}
-{translator.t('average_score').format(stats['average'])}
-{translator.t('highest_score').format(stats['highest'])}
-{translator.t('lowest_score').format(stats['lowest'])}
-{translator.t('pass_rate').format(stats['pass_rate'])}
-"""
+        stats_text = _stats_template(translator.current_lang()).format(**self.grading_system.compute_stats())
         self.stats_display.setText(stats_text)
 
     def enable_export_controls(self) -> None:
@@ -374,6 +450,11 @@ class GradingWidget(QWidget):
         self.export_class_btn.setEnabled(False)
         self.clear_results_btn.setEnabled(False)
 
+    @staticmethod
+    def _export_path(name: str) -> str:
+        """Suggest `name` inside the last export directory, if there is one"""
+        return str(Path(AppConfig.last_export_dir) / name) if AppConfig.last_export_dir else name
+
     def export_csv(self) -> None:
         """Export results to CSV"""
         if not self.grading_system.results:
@@ -382,11 +463,12 @@ class GradingWidget(QWidget):
 
         filename, _ = QFileDialog.getSaveFileName(
             self, translator.t('export_csv'),
-            build_timestamped_filename('omr_results', 'csv'),
+            self._export_path(build_timestamped_filename('omr_results', 'csv')),
             translator.t('file_filter_csv')
         )
 
         if filename:
+            AppConfig.last_export_dir = str(Path(filename).parent)
             if self.grading_system.export_to_csv(filename):
                 self.log.info("CSV export success: %s", filename)
                 ErrorHandler.show_info(self, translator.t('success'), translator.t('export_success'))
@@ -407,11 +489,12 @@ class GradingWidget(QWidget):
 
         filename, _ = QFileDialog.getSaveFileName(
             self, translator.t('export_excel'),
-            build_timestamped_filename('omr_results', 'xlsx'),
+            self._export_path(build_timestamped_filename('omr_results', 'xlsx')),
             translator.t('file_filter_excel')
         )
 
         if filename:
+            AppConfig.last_export_dir = str(Path(filename).parent)
             if self.grading_system.export_to_excel(filename):
                 self.log.info("Excel export success: %s", filename)
                 ErrorHandler.show_info(self, translator.t('success'), translator.t('export_success'))
@@ -427,11 +510,12 @@ class GradingWidget(QWidget):
 
         filename, _ = QFileDialog.getSaveFileName(
             self, translator.t('export_class_report'),
-            build_timestamped_filename('class_report', 'pdf'),
+            self._export_path(build_timestamped_filename('class_report', 'pdf')),
             translator.t('file_filter_pdf')
         )
 
         if filename:
+            AppConfig.last_export_dir = str(Path(filename).parent)
             if generate_class_report(self.grading_system, filename):
                 self.log.info("Class report PDF generated: %s", filename)
                 ErrorHandler.show_info(self, translator.t('success'), translator.t('export_success'))
@@ -443,8 +527,7 @@ class GradingWidget(QWidget):
     def clear_all_results(self) -> None:
         """Clear all results after confirmation"""
         if ErrorHandler.confirm(self, translator.t('clear_results_title'), translator.t('clear_results_confirm')):
-            self.grading_system.results.clear()
-            self.students_table.setRowCount(0)
+            self.students_model.clear()
             self.stats_display.clear()
             self.grade_display.clear()
             self.disable_export_controls()
@@ -452,38 +535,43 @@ class GradingWidget(QWidget):
 
     def refresh_ui(self) -> None:
         """Refresh UI elements with current language"""
+        lang = translator.current_lang()
+        if lang != self._lang:
+            # Entries for the previous language will not be asked for again
+            _tt.cache_clear()
+            self._lang = lang
         # Update group titles and labels
-        self.title_label.setText(translator.t('grading_title'))
+        self.title_label.setText(_tt('grading_title', lang))
         if hasattr(self, "load_group"):
-            self.load_group.setTitle(translator.t('load_scan_results'))
+            self.load_group.setTitle(_tt('load_scan_results', lang))
         if hasattr(self, "student_group"):
-            self.student_group.setTitle(translator.t('student_info'))
+            self.student_group.setTitle(_tt('student_info', lang))
         if hasattr(self, "batch_group"):
-            self.batch_group.setTitle(translator.t('batch_processing'))
+            self.batch_group.setTitle(_tt('batch_processing', lang))
         if hasattr(self, "stats_group"):
-            self.stats_group.setTitle(translator.t('class_statistics'))
+            self.stats_group.setTitle(_tt('class_statistics', lang))
         if hasattr(self, "export_group"):
-            self.export_group.setTitle(translator.t('export_results'))
+            self.export_group.setTitle(_tt('export_results', lang))
         if hasattr(self, "current_group"):
-            self.current_group.setTitle(translator.t('grade_sheet'))
+            self.current_group.setTitle(_tt('grade_sheet', lang))
         if hasattr(self, "students_group"):
-            self.students_group.setTitle(translator.t('students_processed_title'))
-        self.student_name_label.setText(translator.t('student_name_field'))
-        self.student_id_label.setText(translator.t('student_id_field'))
+            self.students_group.setTitle(_tt('students_processed_title', lang))
+        self.student_name_label.setText(_tt('student_name_field', lang))
+        self.student_id_label.setText(_tt('student_id_field', lang))
         # Update placeholders
-        self.student_name_edit.setPlaceholderText(translator.t('student_name_placeholder'))
-        self.student_id_edit.setPlaceholderText(translator.t('student_id_placeholder'))
+        self.student_name_edit.setPlaceholderText(_tt('student_name_placeholder', lang))
+        self.student_id_edit.setPlaceholderText(_tt('student_id_placeholder', lang))
 
         # Update buttons
-        self.load_results_btn.setText(translator.t('load_results_btn'))
-        self.calculate_grade_btn.setText(translator.t('calculate_grade'))
-        self.add_student_btn.setText(translator.t('add_student'))
-        self.remove_student_btn.setText(translator.t('remove_student'))
-        self.export_csv_btn.setText(translator.t('export_csv'))
+        self.load_results_btn.setText(_tt('load_results_btn', lang))
+        self.calculate_grade_btn.setText(_tt('calculate_grade', lang))
+        self.add_student_btn.setText(_tt('add_student', lang))
+        self.remove_student_btn.setText(_tt('remove_student', lang))
+        self.export_csv_btn.setText(_tt('export_csv', lang))
         if hasattr(self, 'export_excel_btn'):
-            self.export_excel_btn.setText(translator.t('export_excel'))
-        self.export_class_btn.setText(translator.t('export_class_report'))
-        self.clear_results_btn.setText(translator.t('clear_all_results'))
+            self.export_excel_btn.setText(_tt('export_excel', lang))
+        self.export_class_btn.setText(_tt('export_class_report', lang))
+        self.clear_results_btn.setText(_tt('clear_all_results', lang))
 
         # Update table headers
         self._update_table_headers()
@@ -493,4 +581,4 @@ class GradingWidget(QWidget):
             self.update_class_statistics()
         # Update info label under Load Results when no file loaded
         if hasattr(self, 'scan_info') and not self.scan_results:
-            self.scan_info.setText(translator.t('select_omr_results'))
+            self.scan_info.setText(_tt('select_omr_results', lang))
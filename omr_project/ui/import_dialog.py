@@ -1,7 +1,11 @@
 from ui.ui_helpers import UIHelpers
 from utils.error_handling import ErrorHandler
+import codecs
 import csv
-from typing import List
+import io
+from itertools import islice
+from typing import Iterator, List, Optional, Tuple
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import (
     QCheckBox, QDialog, QFileDialog, QHBoxLayout, QLabel, QLineEdit,
     QTableWidget, QTableWidgetItem, QVBoxLayout
@@ -11,10 +15,68 @@ try:
     import pandas as pd  # type: ignore
 except ImportError:  # pragma: no cover
     pd = None  # type: ignore
+try:
+    import charset_normalizer  # type: ignore
+    CHARSET_NORMALIZER_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    CHARSET_NORMALIZER_AVAILABLE = False
 from core.models.question_model import Question
 from i18n.translator import get_option_letter, translator
+from config.app_config import AppConfig
 from config.logger_config import get_logger, UI_LOGGER_NAME
 
+PREVIEW_ROWS = 10  # Data rows shown in the preview table
+_SNIFF_BYTES = 64 * 1024  # Leading bytes inspected to pick a CSV encoding
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+# Correct-answer letters accepted in imported files (English A-D in either case, or Greek Α-Δ)
+_CORRECT_MAP = {
+    **{c: i for i, c in enumerate('ABCD')},
+    **{c: i for i, c in enumerate('abcd')},
+    **{c: i for i, c in enumerate('ΑΒΓΔ')},
+}
+
+
+def _parse_points(value) -> int:
+    """Parse a points cell to a positive integer, defaulting to 1.
+
+    Spreadsheet cells already arrive as numbers and are used as-is; only
+    text cells go through float().
+    """
+    try:
+        points_value = value if isinstance(value, (int, float)) else float(str(value))
+        return max(1, round(points_value))
+    except (ValueError, TypeError):
+        return 1
+
+
+def _sniff_encoding(head: bytes) -> str:
+    """Pick a CSV encoding from its leading bytes.
+
+    A BOM wins, then UTF-8 if the bytes decode as such. Other content is
+    detected with charset-normalizer when it is installed, falling back to
+    Latin-1 (which accepts any byte sequence).
+    """
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    try:
+        # Incremental so a multi-byte character cut off at the sniff boundary still counts as UTF-8
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    if CHARSET_NORMALIZER_AVAILABLE:
+        match = charset_normalizer.from_bytes(head).best()
+        if match is not None:
+            return match.encoding
+    return 'latin-1'
+
 
 class ImportDialog(QDialog):
     """CSV/Excel import dialog with preview"""
@@ -22,7 +84,10 @@ class ImportDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.imported_questions: List[Question] = []
-        self.raw_data: List[List[str]] = []
+        self.raw_data: List[List[str]] = []  # Header + preview rows; the full file is read on import
+        self._csv_source: Optional[Tuple[str, str]] = None  # (filename, encoding) streamed on import
+        self._excel_path: Optional[str] = None  # Sheet re-read in full on import
+        self._preview_headers: List[str] = []  # Header labels currently shown in the preview
         self.log = get_logger(UI_LOGGER_NAME)
         self.setup_ui()
 
@@ -53,7 +118,7 @@ class ImportDialog(QDialog):
         # Options
         self.has_headers_cb = QCheckBox(translator.t('has_headers'))
         self.has_headers_cb.setChecked(True)
-        self.has_headers_cb.stateChanged.connect(self.refresh_preview)
+        self.has_headers_cb.stateChanged.connect(self._schedule_refresh)
         self.clear_existing_cb = QCheckBox(translator.t('clear_existing'))
 
         options_layout = QHBoxLayout()
@@ -73,6 +138,17 @@ class ImportDialog(QDialog):
 
         self.setLayout(layout)
 
+        # Coalesces rapid header toggles into one preview rebuild
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(AppConfig.TOGGLE_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self.refresh_preview)
+
+    def _schedule_refresh(self):
+        """Rebuild the preview once toggling settles."""
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
     def browse_file(self):
         filters = translator.t('file_filter_csv')
         if EXCEL_AVAILABLE:
@@ -101,35 +177,45 @@ class ImportDialog(QDialog):
             ErrorHandler.show_error(self, translator.t('error'), translator.t('load_file_failed').format(str(e)))
 
     def _load_csv_file(self, filename: str):
-        """Load CSV with multiple encoding attempts"""
-        for encoding in ['utf-8-sig', 'utf-8', 'latin-1', 'cp1252']:
-            try:
-                with open(filename, 'r', encoding=encoding) as f:
-                    self.raw_data = list(csv.reader(f))
-                return
-            except UnicodeDecodeError:
-                continue
-            except Exception as e:
-                if encoding == 'cp1252':
-                    raise ValueError(f"Failed to read CSV file: {str(e)}")
-
-        # Final fallback with error replacement
+        """Load the CSV preview rows; the full file is streamed later by import_questions"""
         try:
-            with open(filename, 'r', encoding='utf-8', errors='replace') as f:
-                self.raw_data = list(csv.reader(f))
+            with open(filename, 'rb') as raw:
+                encoding = _sniff_encoding(raw.read(_SNIFF_BYTES))
+                raw.seek(0)
+                text = io.TextIOWrapper(raw, encoding=encoding, errors='replace', newline='')
+                # Header row plus the preview rows, decoded in the same single pass
+                self.raw_data = list(islice(csv.reader(text), PREVIEW_ROWS + 1))
         except Exception as e:
-            raise ValueError(f"Unable to read CSV file: {str(e)}")
+            raise ValueError(f"Failed to read CSV file: {str(e)}")
+        self._csv_source = (filename, encoding)
+        self._excel_path = None
+
+    def _iter_rows(self) -> Iterator[List[str]]:
+        """Yield every row of the loaded file, streaming CSV files instead of holding them in memory"""
+        if self._excel_path is not None:
+            df = pd.read_excel(self._excel_path, header=None, engine='openpyxl').fillna('')
+            # Row tuples straight from the frame, without a list-of-lists copy of the sheet
+            yield from df.itertuples(index=False, name=None)
+        elif self._csv_source is not None:
+            filename, encoding = self._csv_source
+            with open(filename, 'r', encoding=encoding, errors='replace', newline='') as f:
+                yield from csv.reader(f)
+        else:
+            yield from self.raw_data
 
     def _load_excel_file(self, filename: str):
-        """Load Excel file"""
+        """Load the Excel preview rows; the full sheet is read later by import_questions"""
         try:
-            df = pd.read_excel(filename, header=None, engine='openpyxl')
+            df = pd.read_excel(filename, header=None, nrows=PREVIEW_ROWS + 1, engine='openpyxl')
             df = df.fillna('')  # Convert NaN to empty strings
             self.raw_data = df.values.tolist()
+            self._excel_path = filename
+            self._csv_source = None
         except Exception as e:
             raise ValueError(f"Failed to read Excel file: {str(e)}")
 
     def refresh_preview(self):
+        self._refresh_timer.stop()
         if not self.raw_data:
             return
 
@@ -138,14 +224,35 @@ class ImportDialog(QDialog):
         headers = (self.raw_data[0] if has_headers and len(self.raw_data) > 0
                   else [f"Column {i+1}" for i in range(len(self.raw_data[0]) if self.raw_data and self.raw_data[0] else 0)])
 
-        self.preview_table.setRowCount(min(len(data), 10))
-        self.preview_table.setColumnCount(len(headers))
-        self.preview_table.setHorizontalHeaderLabels([str(h) for h in headers])
-
-        for row in range(min(len(data), 10)):
-            for col in range(len(headers)):
-                item_text = str(data[row][col]) if row < len(data) and col < len(data[row]) and data[row][col] is not None else ""
-                self.preview_table.setItem(row, col, QTableWidgetItem(item_text))
+        table = self.preview_table
+        row_count = min(len(data), PREVIEW_ROWS)
+        col_count = len(headers)
+        # One repaint for the whole grid instead of one per cell
+        table.setUpdatesEnabled(False)
+        try:
+            # Structural changes only when the shape or labels actually differ (e.g. not on a
+            # header toggle that keeps the column count)
+            if table.rowCount() != row_count:
+                table.setRowCount(row_count)
+            if table.columnCount() != col_count:
+                table.setColumnCount(col_count)
+            header_labels = [str(h) for h in headers]
+            if header_labels != self._preview_headers:
+                table.setHorizontalHeaderLabels(header_labels)
+                self._preview_headers = header_labels
+
+            # Cells left from the previous preview are reused; only missing ones are created.
+            # The table owns its items (shrinking deletes them), so they are looked up, not kept
+            for row in range(row_count):
+                for col in range(col_count):
+                    item_text = str(data[row][col]) if row < len(data) and col < len(data[row]) and data[row][col] is not None else ""
+                    item = table.item(row, col)
+                    if item is None:
+                        table.setItem(row, col, QTableWidgetItem(item_text))
+                    elif item.text() != item_text:
+                        item.setText(item_text)
+        finally:
+            table.setUpdatesEnabled(True)
 
     def import_questions(self):
         try:
@@ -162,39 +269,37 @@ class ImportDialog(QDialog):
         if not self.raw_data:
             return []
 
-        has_headers = self.has_headers_cb.isChecked()
-        data = self.raw_data[1:] if has_headers and len(self.raw_data) > 1 else self.raw_data
+        rows = self._iter_rows()
+        if self.has_headers_cb.isChecked() and len(self.raw_data) > 1:
+            next(rows, None)  # Skip the header row
         questions = []
+        # Language dependent, so resolved per import rather than at module load
+        first_letter = get_option_letter(0)
+        default_options = [f"Option {get_option_letter(i)}" for i in range(4)]
 
-        for row in data:
+        for row in rows:
             if not row or len(row) < 1:
                 continue
 
+            n = len(row)
             question = Question()
-            question.text = str(row[0]).strip() if len(row) > 0 else "Question"
-            question.options = [str(row[i]).strip() if i < len(row) else f"Option {get_option_letter(i-1)}" for i in range(1, 5)]
+            question.text = str(row[0]).strip() if n > 0 else "Question"
+            # Options are stripped once here; the count below only tests for emptiness
+            options = [str(row[i]).strip() if i < n else default_options[i-1] for i in range(1, 5)]
+            question.options = options
+            valid_option_count = sum(1 for opt in options if opt)
 
             # Handle correct answer (English A,B,C,D or Greek Α,Β,Γ,Δ)
-            correct = str(row[5]).strip() if len(row) > 5 else get_option_letter(0)
-            correct_index = 0
-            if correct.upper() in 'ABCD':
-                correct_index = ord(correct.upper()) - ord('A')
-            elif correct in 'ΑΒΓΔ':
-                greek_map = {'Α': 0, 'Β': 1, 'Γ': 2, 'Δ': 3}
-                correct_index = greek_map.get(correct, 0)
-
-            valid_option_count = len([opt for opt in question.options if opt.strip()])
+            correct = str(row[5]).strip() if n > 5 else first_letter
+            correct_index = _CORRECT_MAP.get(correct, 0)
+
             question.correct = correct_index if correct_index < valid_option_count else 0
 
             # Handle points
-            if len(row) > 6:
-                try:
-                    points_value = float(str(row[6]))
-                    question.points = max(1, round(points_value))
-                except (ValueError, TypeError):
-                    question.points = 1
-
-            if question.text and len([opt for opt in question.options if opt.strip()]) >= 2:
+            if n > 6:
+                question.points = _parse_points(row[6])
+
+            if question.text and valid_option_count >= 2:
                 questions.append(question)
 
         return questions
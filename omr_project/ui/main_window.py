@@ -1,18 +1,17 @@
 from ui.app_style import get_styles
 from ui.form_designer import FormDesigner
-from ui.settings_dialog import SettingsDialog
 from core.models.form_model import Form
-from ui.grading_widget import GradingWidget
-from ui.scanner_widget import ScannerWidget
 from i18n import translator
+# Scanner, Grading and Settings widgets are imported on first use, keeping PyMuPDF,
+# the zoomable image view and the report/table modules out of startup
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 import sys
 
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QTabWidget, QLabel, QHBoxLayout, QPushButton
+    QMainWindow, QWidget, QVBoxLayout, QTabWidget, QLabel, QHBoxLayout, QPushButton, QButtonGroup
 )
-from PyQt6.QtCore import Qt, QSettings
+from PyQt6.QtCore import Qt, QSettings, pyqtSlot
 from utils.error_handling import ErrorHandler
 
 
@@ -24,11 +23,18 @@ class OMRUnifiedApp(QMainWindow):
     THEME_LABEL_STYLE = "color: #6b7280; font-weight: bold; padding: 4px; text-decoration: underline;"
     THEME_LABEL_DARK_STYLE = "color: #94a3b8; font-weight: bold; padding: 4px; text-decoration: underline;"
     VALIDATION_ERROR_STYLE = "font-weight: bold; padding: 4px; text-decoration: underline;"
+    VALIDATION_INVALID_FULL = f"color: #c62828; {VALIDATION_ERROR_STYLE}"
+    VALIDATION_WARN_FULL = f"color: #f57c00; {VALIDATION_ERROR_STYLE}"
 
     def __init__(self):
         super().__init__()
 
         self.dark_mode = False
+        # One settings object for the window's lifetime; writes are flushed to disk on close
+        self._settings = QSettings()
+        self._applied_stylesheet = None  # Stylesheet object currently set on the window
+        self.tab_buttons: list[QPushButton] = []  # Filled by _build_centered_tab_header
+        self.toggle_theme_action = None  # Optional checkable action mirroring dark_mode
         self.current_validation_summary = {"status": "valid", "message": "", "errors": []}
 
         self.setWindowTitle(translator.t('app_title'))
@@ -69,13 +75,13 @@ class OMRUnifiedApp(QMainWindow):
         self.designer_tab.validation_changed.connect(self.update_validation)
         self.tab_widget.addTab(self.designer_tab, translator.t('tab_designer'))
 
-        # Scanner tab
-        self.scanner_tab = ScannerWidget(self)
-        self.tab_widget.addTab(self.scanner_tab, translator.t('tab_scanner'))
-
-        # Grading tab
-        self.grading_tab = GradingWidget(self)
-        self.tab_widget.addTab(self.grading_tab, translator.t('tab_grading'))
+        # Scanner and Grading tabs are built the first time they are shown;
+        # until then each page is an empty container
+        self.scanner_tab = None
+        self.grading_tab = None
+        self.tab_widget.addTab(self._lazy_tab_page(), translator.t('tab_scanner'))
+        self.tab_widget.addTab(self._lazy_tab_page(), translator.t('tab_grading'))
+        self._tab_factories = {1: self._create_scanner_tab, 2: self._create_grading_tab}
 
         # Build centered tab header with buttons
         self._build_centered_tab_header(layout)
@@ -89,8 +95,47 @@ class OMRUnifiedApp(QMainWindow):
         self.create_status_bar()
 
         # Apply initial theme
-        self.setStyleSheet(get_styles(self.dark_mode))
-        QSettings().setValue('dark_mode', self.dark_mode)
+        self.apply_theme()
+        self._settings.setValue('dark_mode', self.dark_mode)
+
+    def apply_theme(self) -> None:
+        """Apply the stylesheet for the current theme.
+
+        get_styles builds each theme's stylesheet once per process and hands
+        back the same string afterwards, so switching themes only costs Qt's
+        own style pass. Re-applying the theme already in place is skipped, since
+        setStyleSheet re-polishes every widget in the window even for an
+        identical sheet.
+        """
+        qss = get_styles(self.dark_mode)
+        if qss is self._applied_stylesheet:
+            return
+        self.setStyleSheet(qss)
+        self._applied_stylesheet = qss
+
+    @staticmethod
+    def _lazy_tab_page() -> QWidget:
+        """Empty tab page that receives its real widget on first activation."""
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        return page
+
+    def _create_scanner_tab(self) -> QWidget:
+        from ui.scanner_widget import ScannerWidget
+        self.scanner_tab = ScannerWidget(self)
+        return self.scanner_tab
+
+    def _create_grading_tab(self) -> QWidget:
+        from ui.grading_widget import GradingWidget
+        self.grading_tab = GradingWidget(self)
+        return self.grading_tab
+
+    def _ensure_tab(self, index: int) -> None:
+        """Build the widget of a lazily created tab if it does not exist yet."""
+        factory = self._tab_factories.pop(index, None)
+        if factory is not None:
+            self.tab_widget.widget(index).layout().addWidget(factory())
 
     def _build_centered_tab_header(self, parent_layout: QVBoxLayout) -> None:
         """Create a centered header with buttons acting as tabs."""
@@ -105,28 +150,32 @@ class OMRUnifiedApp(QMainWindow):
         hlayout.addStretch()
 
         titles = [translator.t('tab_designer'), translator.t('tab_scanner'), translator.t('tab_grading')]
-        self.tab_buttons: list[QPushButton] = []
+        # Exclusive group: one checked button at a time, and a single id-based connection
+        # instead of a closure per button
+        self.tab_button_group = QButtonGroup(self)
+        self.tab_button_group.setExclusive(True)
         for idx, title in enumerate(titles):
             btn = QPushButton(title)
             btn.setCheckable(True)
             # First button checked initially
             if idx == 0:
                 btn.setChecked(True)
-            # Capture index in lambda default
-            btn.clicked.connect(lambda checked=False, i=idx: self.tab_widget.setCurrentIndex(i))
+            self.tab_button_group.addButton(btn, idx)
             self.tab_buttons.append(btn)
             hlayout.addWidget(btn)
+        self.tab_button_group.idClicked.connect(self.tab_widget.setCurrentIndex)
 
         hlayout.addStretch()
         parent_layout.addWidget(header)
 
+    @pyqtSlot(int)
     def _on_tab_changed(self, index: int) -> None:
         """Sync button checked state when tab changes."""
-        try:
-            for i, btn in enumerate(getattr(self, 'tab_buttons', [])):
-                btn.setChecked(i == index)
-        except Exception:
-            pass
+        self._ensure_tab(index)
+        # The exclusive group unchecks the previous button
+        btn = self.tab_button_group.button(index)
+        if btn is not None:
+            btn.setChecked(True)
 
     def create_menu(self) -> None:
         """Create application menu"""
@@ -134,45 +183,55 @@ class OMRUnifiedApp(QMainWindow):
         self.refresh_menu()
 
     def refresh_menu(self) -> None:
-        """Refresh menu with current language"""
+        """Build the menu bar in the current language (see retranslate_menu for language changes)"""
         self.menubar.clear()
+        # (action, translation key, suffix) for every translated entry, so a language
+        # change only relabels them instead of rebuilding the menus
+        self._menu_actions: List[Tuple[Any, str, str]] = []
+        track = lambda action, key, suffix='': self._menu_actions.append((action, key, suffix))
 
         # File menu
         file_menu = self.menubar.addMenu(translator.t('menu_file'))
+        track(file_menu.menuAction(), 'menu_file')
 
         menu_items = [
-            (translator.t('menu_new'), 'Ctrl+N', self.new_file),
-            (translator.t('menu_load'), 'Ctrl+O', self.designer_tab.load_form),
-            (translator.t('menu_save'), 'Ctrl+S', self.designer_tab.save_form),
+            ('menu_new', 'Ctrl+N', self.new_file),
+            ('menu_load', 'Ctrl+O', self.designer_tab.load_form),
+            ('menu_save', 'Ctrl+S', self.designer_tab.save_form),
             None,  # Separator
-            (translator.t('menu_exit'), 'Ctrl+Q', self.close)
+            ('menu_exit', 'Ctrl+Q', self.close)
         ]
 
         for item in menu_items:
             if item is None:
                 file_menu.addSeparator()
             else:
-                action = file_menu.addAction(item[0])
+                action = file_menu.addAction(translator.t(item[0]))
                 action.setShortcut(item[1])
                 action.triggered.connect(item[2])
+                track(action, item[0])
 
         # Export menu
         export_menu = self.menubar.addMenu(translator.t('menu_export'))
+        track(export_menu.menuAction(), 'menu_export')
 
         export_items = [
-            (translator.t('menu_export_pdf'), 'Ctrl+E', self.designer_tab.export_pdf),
-            (translator.t('menu_export_omr'), 'Ctrl+Shift+E', self.designer_tab.export_omr_sheet),
-            (translator.t('menu_export_scanner'), 'Ctrl+Alt+E', self.designer_tab.export_for_scanner)
+            ('menu_export_pdf', 'Ctrl+E', self.designer_tab.export_pdf),
+            ('menu_export_omr', 'Ctrl+Shift+E', self.designer_tab.export_omr_sheet),
+            ('menu_export_scanner', 'Ctrl+Alt+E', self.designer_tab.export_for_scanner)
         ]
 
-        for text, shortcut, callback in export_items:
-            action = export_menu.addAction(text)
+        for key, shortcut, callback in export_items:
+            action = export_menu.addAction(translator.t(key))
             action.setShortcut(shortcut)
             action.triggered.connect(callback)
+            track(action, key)
 
         # Import menu
         import_menu = self.menubar.addMenu(translator.t('menu_import'))
+        track(import_menu.menuAction(), 'menu_import')
         import_action = import_menu.addAction(translator.t('menu_import_csv'))
+        track(import_action, 'menu_import_csv')
         import_action.setShortcut('Ctrl+I')
         import_action.triggered.connect(self.designer_tab.import_questions)
 
@@ -198,7 +257,9 @@ class OMRUnifiedApp(QMainWindow):
         else:
             # Other platforms: show a Settings menu with a single Settings… action
             settings_menu = self.menubar.addMenu(translator.t('menu_settings'))
+            track(settings_menu.menuAction(), 'menu_settings')
             settings_action = settings_menu.addAction(translator.t('preferences_title') + '…')
+            track(settings_action, 'preferences_title', '…')
             try:
                 settings_action.setShortcut('Ctrl+,')
             except Exception:
@@ -206,7 +267,13 @@ class OMRUnifiedApp(QMainWindow):
             settings_action.setEnabled(True)
             settings_action.triggered.connect(self.open_settings)
 
+    def retranslate_menu(self) -> None:
+        """Relabel the existing menu entries in the current language"""
+        for action, key, suffix in self._menu_actions:
+            action.setText(translator.t(key) + suffix)
+
     def open_settings(self) -> None:
+        from ui.settings_dialog import SettingsDialog
         dlg = SettingsDialog(self)
         if dlg.exec() == dlg.DialogCode.Accepted:
             dlg.save()
@@ -215,9 +282,7 @@ class OMRUnifiedApp(QMainWindow):
     def apply_preferences(self) -> None:
         from utils.config_check import validate_config as _validate
         from config.app_config import AppConfig as _Cfg
-        from ui.app_style import get_styles as _styles
-        from PyQt6.QtCore import QSettings
-        s = QSettings()
+        s = self._settings
         lang = s.value('language')
         if lang:
             translator.set_language(str(lang))
@@ -236,18 +301,8 @@ class OMRUnifiedApp(QMainWindow):
         if dm is not None:
             val = str(dm).lower() in ('1', 'true', 'yes')
             self.dark_mode = val
-            self.setStyleSheet(_styles(self.dark_mode))
-        self.setWindowTitle(translator.t('app_title'))
-        self.refresh_menu()
-        self.validation_label.setText(translator.t('form_validation_valid'))
-        # Theme label is removed from status bar; nothing to update here
-        self.tab_widget.setTabText(0, translator.t('tab_designer'))
-        self.tab_widget.setTabText(1, translator.t('tab_scanner'))
-        self.tab_widget.setTabText(2, translator.t('tab_grading'))
-        self._update_tab_header_labels()
-        self.designer_tab.refresh_ui()
-        self.scanner_tab.refresh_ui()
-        self.grading_tab.refresh_ui()
+            self.apply_theme()
+        self._retranslate_all()
 
     def create_status_bar(self) -> None:
         """Create status bar with validation and theme controls"""
@@ -261,18 +316,22 @@ class OMRUnifiedApp(QMainWindow):
 
         # Theme toggle removed; menu View -> Toggle Theme controls theme
 
+    @pyqtSlot(dict)
     def update_validation(self, summary: Dict[str, Any]) -> None:
         """Update validation display in status bar"""
         self.current_validation_summary = summary
-        if summary["status"] == "valid":
+        status = summary["status"]
+        if status == "valid":
             self.validation_label.setText(translator.t('form_validation_valid'))
-            self.validation_label.setStyleSheet(self.VALIDATION_VALID_STYLE)
+            style = self.VALIDATION_VALID_STYLE
             self.validation_label.setCursor(Qt.CursorShape.ArrowCursor)
         else:
             self.validation_label.setText(f"⚠ {summary['message']} {translator.t('click_details')}")
-            color = "#c62828" if summary["status"] == "invalid" else "#f57c00"
-            self.validation_label.setStyleSheet(f"color: {color}; {self.VALIDATION_ERROR_STYLE}")
+            style = self.VALIDATION_INVALID_FULL if status == "invalid" else self.VALIDATION_WARN_FULL
             self.validation_label.setCursor(Qt.CursorShape.PointingHandCursor)
+        # An unchanged status keeps the label's parsed style instead of resetting it per keystroke
+        if self.validation_label.styleSheet() != style:
+            self.validation_label.setStyleSheet(style)
 
     def new_file(self) -> None:
         """Create new form"""
@@ -294,59 +353,63 @@ class OMRUnifiedApp(QMainWindow):
     def toggle_theme(self, event=None) -> None:
         """Toggle between dark and light themes"""
         self.dark_mode = not self.dark_mode
-        self.setStyleSheet(get_styles(self.dark_mode))
-        QSettings().setValue('dark_mode', self.dark_mode)
-        if hasattr(self, 'toggle_theme_action'):
-            try:
-                self.toggle_theme_action.setChecked(self.dark_mode)
-            except Exception:
-                pass
+        self.apply_theme()
+        self._settings.setValue('dark_mode', self.dark_mode)
+        if self.toggle_theme_action is not None:
+            self.toggle_theme_action.setChecked(self.dark_mode)
 
         # Theme label removed from status bar; no direct label updates
 
     def set_theme_checked(self, enabled: bool) -> None:
         """Apply theme directly from a checkable action state."""
+        if enabled == self.dark_mode:
+            return
         self.dark_mode = enabled
-        self.setStyleSheet(get_styles(self.dark_mode))
-        QSettings().setValue('dark_mode', self.dark_mode)
+        self.apply_theme()
+        self._settings.setValue('dark_mode', self.dark_mode)
         # Theme label removed from status bar; no direct label updates
 
     def change_language(self, lang_code: str) -> None:
         """Change application language"""
         translator.set_language(lang_code)
-        QSettings().setValue('language', lang_code)
+        self._settings.setValue('language', lang_code)
+        self._retranslate_all()
 
-        # Update window and UI elements
-        self.setWindowTitle(translator.t('app_title'))
-        self.refresh_menu()
-
-        # Update status bar
-        self.validation_label.setText(translator.t('form_validation_valid'))
-        # Theme label is removed from status bar; nothing to update here
-
-        # Update tab titles
-        self.tab_widget.setTabText(0, translator.t('tab_designer'))
-        self.tab_widget.setTabText(1, translator.t('tab_scanner'))
-        self.tab_widget.setTabText(2, translator.t('tab_grading'))
-        self._update_tab_header_labels()
-
-        # Refresh all tabs UI
-        self.designer_tab.refresh_ui()
-        self.scanner_tab.refresh_ui()
-        self.grading_tab.refresh_ui()
         # Persist normalized page settings for future preferences UI
         try:
             from config.app_config import AppConfig as _Cfg
-            QSettings().setValue('page_size', (_Cfg.DEFAULT_PAGE_SIZE.value if hasattr(_Cfg.DEFAULT_PAGE_SIZE, "value") else str(_Cfg.DEFAULT_PAGE_SIZE)))
-            QSettings().setValue('page_orientation', (_Cfg.DEFAULT_PAGE_ORIENTATION.value if hasattr(_Cfg.DEFAULT_PAGE_ORIENTATION, "value") else str(_Cfg.DEFAULT_PAGE_ORIENTATION)))
+            self._settings.setValue('page_size', (_Cfg.DEFAULT_PAGE_SIZE.value if hasattr(_Cfg.DEFAULT_PAGE_SIZE, "value") else str(_Cfg.DEFAULT_PAGE_SIZE)))
+            self._settings.setValue('page_orientation', (_Cfg.DEFAULT_PAGE_ORIENTATION.value if hasattr(_Cfg.DEFAULT_PAGE_ORIENTATION, "value") else str(_Cfg.DEFAULT_PAGE_ORIENTATION)))
         except Exception:
             pass
 
+    def _retranslate_all(self) -> None:
+        """Relabel the window, menu, status bar and tabs in the current language.
+
+        Scanner and Grading tabs that have not been opened yet are skipped;
+        they are built in the current language when first shown.
+        """
+        self.setWindowTitle(translator.t('app_title'))
+        self.retranslate_menu()
+        # Theme label is removed from status bar; only the validation label needs text
+        self.validation_label.setText(translator.t('form_validation_valid'))
+        for i, key in enumerate(('tab_designer', 'tab_scanner', 'tab_grading')):
+            self.tab_widget.setTabText(i, translator.t(key))
+        self._update_tab_header_labels()
+        for tab in (self.designer_tab, self.scanner_tab, self.grading_tab):
+            if tab is not None:
+                tab.refresh_ui()
+
+    def closeEvent(self, event):  # noqa: N802
+        """Finish background work and flush pending preference writes before the window closes."""
+        self.designer_tab.stop_workers()
+        if self.grading_tab is not None:
+            self.grading_tab.stop_workers()
+        self._settings.sync()
+        super().closeEvent(event)
+
     def _update_tab_header_labels(self) -> None:
         """Refresh the centered tab header button labels for current language."""
-        try:
-            titles = [translator.t('tab_designer'), translator.t('tab_scanner'), translator.t('tab_grading')]
-            for btn, title in zip(getattr(self, 'tab_buttons', []), titles):
-                btn.setText(title)
-        except Exception:
-            pass
+        titles = [translator.t('tab_designer'), translator.t('tab_scanner'), translator.t('tab_grading')]
+        for btn, title in zip(self.tab_buttons, titles):
+            btn.setText(title)
@@ -2,15 +2,15 @@ from ui.ui_helpers import UIHelpers
 from config.app_config import AppConfig
 from utils.qt_utils import SignalBlocker
 from core.models.question_model import Question
-from i18n import translator, get_option_letter
+from i18n import translator, first_option_letters
 
 # Typing
-from typing import Optional, List
+from typing import Dict, List, Optional, Set
 
 # PyQt6
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, pyqtSlot
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, QLineEdit, QSizePolicy
+    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QTextEdit, QLineEdit, QSizePolicy
 )
 
 class QuestionEditor(QWidget):
@@ -22,6 +22,14 @@ class QuestionEditor(QWidget):
         self.parent_form = parent
         self.option_edits: List[QLineEdit] = []
         self.option_labels: List[QLabel] = []
+        self._edit_to_index: Dict[QLineEdit, int] = {}
+        # Keystrokes only mark fields dirty; the timer writes them back once typing pauses
+        self._dirty_text = False
+        self._dirty_options: Set[int] = set()  # Indices of option edits changed since the last flush
+        self._dirty_timer = QTimer(self)
+        self._dirty_timer.setSingleShot(True)
+        self._dirty_timer.setInterval(AppConfig.EDIT_DEBOUNCE_MS)
+        self._dirty_timer.timeout.connect(self._flush_dirty)
         self.setup_ui()
 
     def setup_ui(self) -> None:
@@ -41,22 +49,28 @@ class QuestionEditor(QWidget):
         self.answer_options_label = QLabel(translator.t('answer_options_label'))
         layout.addWidget(self.answer_options_label)
 
-        for i in range(AppConfig.MAX_OPTIONS_COUNT):
-            row = QHBoxLayout()
-            label = QLabel(get_option_letter(i))
+        # Letters and the "Option" word are looked up once for all rows
+        letters = first_option_letters(AppConfig.MAX_OPTIONS_COUNT)
+        option_word = translator.t('option')
+        # One grid for all options (letter badge | text field) instead of a layout per row
+        options_grid = QGridLayout()
+        for i, letter in enumerate(letters):
+            label = QLabel(letter)
             label.setFixedSize(30, 30)
             label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            label.setStyleSheet("background: #1e40af; color: white; font-weight: bold;")
+            label.setObjectName("optionLetter")  # Styled by the app stylesheet
             self.option_labels.append(label)
 
             edit = QLineEdit()
-            edit.setPlaceholderText(f"{translator.t('option')} {get_option_letter(i)}")
+            edit.setPlaceholderText(f"{option_word} {letter}")
             edit.textChanged.connect(self.on_option_changed)
+            self._edit_to_index[edit] = i
             self.option_edits.append(edit)
 
-            row.addWidget(label)
-            row.addWidget(edit)
-            layout.addLayout(row)
+            options_grid.addWidget(label, i, 0)
+            options_grid.addWidget(edit, i, 1)
+        options_grid.setColumnStretch(1, 1)  # Text fields take the spare width, as in the old rows
+        layout.addLayout(options_grid)
 
         # Settings row (after listing all options)
         settings = QHBoxLayout()
@@ -66,7 +80,7 @@ class QuestionEditor(QWidget):
         self.correct_label = QLabel(translator.t('correct_label'))
         correct_row.addWidget(self.correct_label)
         self.correct_combo = UIHelpers.create_combo_with_items(
-            [get_option_letter(i) for i in range(AppConfig.MAX_OPTIONS_COUNT)],
+            letters,
             self.on_correct_changed,
             use_index=True
         )
@@ -89,18 +103,26 @@ class QuestionEditor(QWidget):
         layout.addStretch()
         self.setLayout(layout)
 
+        # Input widgets silenced while a question is loaded, collected once here
+        self._input_widgets = (self.text_edit, *self.option_edits, self.correct_combo, self.points_combo)
+
     def load_question(self, question: Optional[Question]) -> None:
         """Load question data into editor"""
-        with SignalBlocker(self.text_edit, *self.option_edits, self.correct_combo, self.points_combo):
+        # Pending keystrokes belong to the outgoing question; the caller refreshes afterwards
+        self.flush_pending_edits()
+        with SignalBlocker(*self._input_widgets):
             self.question = question
             if question:
                 self.text_edit.setPlainText(question.text)
 
-                for i in range(AppConfig.MAX_OPTIONS_COUNT):
-                    text = question.options[i] if i < len(question.options) else ""
-                    self.option_edits[i].setText(text)
+                # Config and list lookups bound once rather than per option
+                max_options = AppConfig.MAX_OPTIONS_COUNT
+                options = question.options
+                n_options = len(options)
+                for i, edit in enumerate(self.option_edits[:max_options]):
+                    edit.setText(options[i] if i < n_options else "")
 
-                self.correct_combo.setCurrentIndex(min(question.correct, AppConfig.MAX_OPTIONS_COUNT - 1))
+                self.correct_combo.setCurrentIndex(min(question.correct, max_options - 1))
                 self.points_combo.setCurrentIndex(max(0, min(question.points - 1, self.points_combo.count() - 1)))
             else:
                 self.clear()
@@ -112,23 +134,58 @@ class QuestionEditor(QWidget):
         self.correct_combo.setCurrentIndex(0)
         self.points_combo.setCurrentIndex(0)
 
+    @pyqtSlot()
     def on_text_changed(self) -> None:
         if self.question:
-            self.question.text = self.text_edit.toPlainText()
-            self._notify_parent()
+            self._dirty_text = True
+            self._dirty_timer.start()
 
+    @pyqtSlot()
     def on_option_changed(self) -> None:
-        if self.question:
-            for i, edit in enumerate(self.option_edits):
-                if i < len(self.question.options):
-                    self.question.options[i] = edit.text()
-            self._notify_parent()
-
+        # Only the edit that emitted is marked, so the flush copies one option, not all of them
+        index = self._edit_to_index.get(self.sender())
+        if self.question and index is not None:
+            self._dirty_options.add(index)
+            self._dirty_timer.start()
+
+    @pyqtSlot()
+    def _flush_dirty(self, notify: bool = True) -> None:
+        """Write edited text/options back to the question and notify the form once."""
+        self._dirty_timer.stop()
+        text_only = self._dirty_text and not self._dirty_options
+        changed = self._dirty_text or bool(self._dirty_options)
+        if self.question and changed:
+            if self._dirty_text:
+                self.question.text = self.text_edit.toPlainText()
+            options = self.question.options
+            for i in self._dirty_options:
+                if i < len(options):
+                    options[i] = self.option_edits[i].text()
+        self._dirty_text = False
+        self._dirty_options.clear()
+        if self.question and changed:
+            if notify:
+                # Question text keeps the form's longer preview debounce
+                self._notify_parent(debounce=text_only)
+            elif self.parent_form and hasattr(self.parent_form, 'mark_question_changed'):
+                # The selection may already point elsewhere; queue this question's row by identity
+                self.parent_form.mark_question_changed(self.question)
+
+    def flush_pending_edits(self) -> None:
+        """Write any debounced keystrokes to the question now, without refreshing the form.
+
+        Called before the question is swapped out and before the form is
+        saved, validated or exported, so none of them see stale text.
+        """
+        self._flush_dirty(notify=False)
+
+    @pyqtSlot(int)
     def on_correct_changed(self, index: int) -> None:
         if self.question:
             self.question.correct = index
             self._notify_parent()
 
+    @pyqtSlot(str)
     def on_points_changed(self, points_str: str) -> None:
         if self.question:
             try:
@@ -137,34 +194,41 @@ class QuestionEditor(QWidget):
                 self.question.points = 1
             self._notify_parent()
 
-    def _notify_parent(self) -> None:
-        if self.parent_form and hasattr(self.parent_form, 'refresh_display'):
+    def _notify_parent(self, debounce: bool = False) -> None:
+        if self.parent_form and hasattr(self.parent_form, 'invalidate_validation'):
+            self.parent_form.invalidate_validation()
+        if debounce and self.parent_form and hasattr(self.parent_form, 'schedule_refresh'):
+            self.parent_form.schedule_refresh()
+        elif self.parent_form and hasattr(self.parent_form, 'refresh_display'):
             self.parent_form.refresh_display()
 
     def refresh_option_letters(self) -> None:
         """Refresh option letters when language changes"""
-        # Update labels
-        label_updates = [
-            ('question_text_label', 'question_text_label'),
-            ('answer_options_label', 'answer_options_label'),
-            ('correct_label', 'correct_label'),
-            ('points_label', 'points_label')
-        ]
-
-        for attr, key in label_updates:
-            if hasattr(self, attr):
-                getattr(self, attr).setText(translator.t(key))
-
-        # Update option labels and placeholders
-        for i, label in enumerate(self.option_labels[:AppConfig.MAX_OPTIONS_COUNT]):
-            label.setText(get_option_letter(i))
-
-        for i in range(min(AppConfig.MAX_OPTIONS_COUNT, len(self.option_edits))):
-            self.option_edits[i].setPlaceholderText(f"{translator.t('option')} {get_option_letter(i)}")
-
-        # Update correct answer combo
-        if hasattr(self, 'correct_combo'):
-            current_index = self.correct_combo.currentIndex()
-            self.correct_combo.clear()
-            self.correct_combo.addItems([get_option_letter(i) for i in range(AppConfig.MAX_OPTIONS_COUNT)])
-            self.correct_combo.setCurrentIndex(current_index)
+        # Update labels (all created by setup_ui, so no existence checks are needed)
+        self.question_text_label.setText(translator.t('question_text_label'))
+        self.answer_options_label.setText(translator.t('answer_options_label'))
+        self.correct_label.setText(translator.t('correct_label'))
+        self.points_label.setText(translator.t('points_label'))
+
+        # Update option labels and placeholders, looking each letter up once
+        letters = first_option_letters(AppConfig.MAX_OPTIONS_COUNT)
+        option_word = translator.t('option')
+        for label, letter in zip(self.option_labels, letters):
+            label.setText(letter)
+
+        for edit, letter in zip(self.option_edits, letters):
+            edit.setPlaceholderText(f"{option_word} {letter}")
+
+        # Update correct answer combo as one silent batch: without blocking, clear() and
+        # addItems() report transient indices (-1, 0) through on_correct_changed
+        combo = self.correct_combo
+        current_index = combo.currentIndex()
+        view = combo.view()
+        view.setUpdatesEnabled(False)
+        try:
+            with SignalBlocker(combo):
+                combo.clear()
+                combo.addItems(letters)
+                combo.setCurrentIndex(current_index)
+        finally:
+            view.setUpdatesEnabled(True)
@@ -1,9 +1,9 @@
 import json
 from pathlib import Path
-import io
 import platform
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
+import numpy as np
 from config.logger_config import get_logger, SCAN_LOGGER_NAME
 from PIL import Image, ImageDraw
 
@@ -23,10 +23,55 @@ except ImportError:  # pragma: no cover
 from utils.error_handling import ErrorHandler
 from core.scanning.worker_threads import WorkerThread, AnchorDetectionCommand, BubbleAnalysisCommand
 from ui.zoomable_image import ZoomableImageLabel
-from core.scanning.scanner_model import BubbleDetector
+from core.scanning.scanner_model import BubbleDetector, clear_image_caches
 from config.app_config import AppConfig
 from i18n import translator
-from core.scanning.opencv import CV2_AVAILABLE
+from core.scanning.opencv import CV2_AVAILABLE, cv2
+
+# Overlay colors (RGB) per option letter; other letters are drawn in purple
+_OPTION_COLORS = {'A': (255, 0, 0), 'B': (0, 128, 0), 'C': (0, 0, 255), 'D': (255, 165, 0)}
+_FALLBACK_COLOR = (128, 0, 128)
+_ANCHOR_COLOR = (255, 255, 0)
+_LABEL_COLOR = (0, 0, 0)
+
+Circle = Tuple[int, int, int, Tuple[int, int, int], int]  # x, y, radius, color, thickness (< 0 fills)
+Rect = Tuple[int, int, int, int, Tuple[int, int, int], int]  # x1, y1, x2, y2, color, thickness
+Label = Tuple[Tuple[int, int], str, Tuple[int, int, int]]  # position, text, color
+
+
+def _render_layer(size: Tuple[int, int], circles: List[Circle], rects: List[Rect], labels: List[Label]) -> Image.Image:
+    """Draw overlay shapes and labels onto a transparent RGBA layer of `size`.
+
+    The layer holds only the annotations, so it can be cached and composited
+    onto the scan whenever the overlay is shown again. With OpenCV the shapes
+    are drawn straight into one NumPy array, each circle or rectangle a single
+    native call; without it PIL's ImageDraw is used. Labels always go through
+    PIL, which (unlike OpenCV's Hershey fonts) renders non-ASCII text such as
+    Greek option letters.
+    """
+    width, height = size
+    if CV2_AVAILABLE:
+        arr = np.zeros((height, width, 4), dtype=np.uint8)
+        for x, y, radius, color, thickness in circles:
+            cv2.circle(arr, (x, y), radius, (*color, 255), thickness)
+        for x1, y1, x2, y2, color, thickness in rects:
+            cv2.rectangle(arr, (x1, y1), (x2, y2), (*color, 255), thickness)
+        layer = Image.fromarray(arr)  # (H, W, 4) uint8 -> RGBA
+        draw = ImageDraw.Draw(layer)
+    else:
+        layer = Image.new('RGBA', size, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(layer)
+        for x, y, radius, color, thickness in circles:
+            box = [max(0, x - radius), max(0, y - radius), min(width, x + radius), min(height, y + radius)]
+            if thickness < 0:
+                draw.ellipse(box, fill=color)
+            else:
+                draw.ellipse(box, outline=color, width=thickness)
+        for x1, y1, x2, y2, color, thickness in rects:
+            draw.rectangle([x1, y1, x2, y2], outline=color, width=thickness)
+    for position, text, color in labels:
+        draw.text(position, text, fill=color)
+    return layer
 
 
 class ScannerWidget(QWidget):
@@ -42,9 +87,18 @@ class ScannerWidget(QWidget):
         self.anchors: Dict[str, Dict[str, Any]] = {}
         self.omr_data: Dict[str, Any] | None = None
         self.bubble_positions: Dict[int, Dict[str, tuple]] = {}
-        self.detector = BubbleDetector()
+        self.detector = BubbleDetector.get_default()
         self.analysis_results: Dict[int, Dict[str, Any]] = {}
         self.answers: Dict[int, str | None] = {}
+        # Answer-key bubbles flattened to arrays (see _flatten_bubble_layout), parsed once per key
+        self._bubble_layout: Tuple[List[int], List[Tuple[int, str]], List[str], np.ndarray, np.ndarray] | None = None
+        # (positions dict, keys, centers): bubble_positions as flat arrays for the detector,
+        # rebuilt only when a new positions dict is assigned
+        self._bubble_soa: Tuple[Dict[int, Dict[str, tuple]], List[Tuple[int, str]], np.ndarray] | None = None
+        # Rendered overlay layers and the scan as RGBA, kept until what they show changes
+        self._base_rgba: Image.Image | None = None
+        self._positions_layer: Image.Image | None = None
+        self._results_layer: Image.Image | None = None
 
         self.setup_ui()
 
@@ -193,21 +247,28 @@ class ScannerWidget(QWidget):
         )
         if not file_path:
             return
+        # Arrays converted from the previous scan are not needed for the next one
+        clear_image_caches()
         try:
             if file_path.lower().endswith('.pdf') and PDF_AVAILABLE:
                 doc = fitz.open(file_path)
                 page = doc[0]
-                mat = fitz.Matrix(AppConfig.EXPORT_DPI / AppConfig.POINTS_PER_INCH,
-                                   AppConfig.EXPORT_DPI / AppConfig.POINTS_PER_INCH)
-                pix = page.get_pixmap(matrix=mat)
-                img_data = pix.tobytes("ppm")
-                self.current_image = Image.open(io.BytesIO(img_data))
+                scale = AppConfig.SCAN_DPI / AppConfig.POINTS_PER_INCH
+                # Opaque RGB at the coordinate DPI: no alpha plane, and gray/CMYK pages arrive as RGB
+                pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False, colorspace=fitz.csRGB)
+                # Wrap MuPDF's sample buffer directly instead of a PPM encode/decode round trip;
+                # copy() detaches the pixels before the document is closed
+                mode = 'RGBA' if pix.alpha else 'RGB'
+                self.current_image = Image.frombuffer(
+                    mode, (pix.width, pix.height), pix.samples, 'raw', mode, pix.stride, 1
+                ).copy()
                 doc.close()
                 self.log.info("Loaded PDF first page: %s", file_path)
             else:
                 temp_image = Image.open(file_path)
                 self.current_image = temp_image.convert('RGB') if temp_image.mode not in ('RGB', 'RGBA') else temp_image
                 self.log.info("Loaded image: %s", file_path)
+            self._base_rgba = None
             self.image_display.set_image(self.current_image)
             filename = Path(file_path).name
             self.image_info.setText(f"✅ {filename}\n{self.current_image.width}×{self.current_image.height}")
@@ -233,6 +294,7 @@ class ScannerWidget(QWidget):
         self.process_btn.setEnabled(True)
         if result['success']:
             self.anchors = result['anchors']
+            self._invalidate_overlays()
             self.status_label.setText(translator.t('anchors_detected').format(result['message']))
             self.load_omr_btn.setEnabled(True)
         else:
@@ -249,6 +311,7 @@ class ScannerWidget(QWidget):
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 self.omr_data = json.load(f)
+            self._bubble_layout = None
             self._transform_coordinates()
             filename = Path(file_path).name
             questions = len(self.omr_data.get('questions', []))
@@ -258,22 +321,52 @@ class ScannerWidget(QWidget):
             ErrorHandler.show_error(self, translator.t('error'), translator.t('load_omr_failed').format(str(e)))
 
     # ================= Processing =================
-    def _transform_coordinates(self) -> None:
-        if not self.anchors or not self.omr_data:
-            return
-        bubble_coords = self.omr_data.get('bubble_coordinates', {})
-        self.bubble_positions = {}
-        for q_str, q_data in bubble_coords.items():
+    def _flatten_bubble_layout(self) -> None:
+        """Parse the answer key's anchor-relative bubbles into flat arrays.
+
+        Produces the question numbers, one (question, option) key per bubble,
+        the distinct anchor names, each bubble's index into those names and
+        an (N, 2) array of offsets, so placing bubbles on a scan is a single
+        array add.
+        """
+        q_nums: List[int] = []
+        keys: List[Tuple[int, str]] = []
+        bubble_anchors: List[str] = []
+        offsets = []
+        for q_str, q_data in self.omr_data.get('bubble_coordinates', {}).items():
             q_num = int(q_str)
-            self.bubble_positions[q_num] = {}
+            q_nums.append(q_num)
             for option, option_data in q_data.items():
                 if isinstance(option_data, dict):
                     rel = option_data.get('relative_to_anchor')
-                    if rel and rel['anchor'] in self.anchors:
-                        anchor = self.anchors[rel['anchor']]
-                        x = anchor['x'] + rel['x']
-                        y = anchor['y'] + rel['y']
-                        self.bubble_positions[q_num][option] = (x, y)
+                    if rel:
+                        keys.append((q_num, option))
+                        bubble_anchors.append(rel['anchor'])
+                        offsets.append((rel['x'], rel['y']))
+        names = list(dict.fromkeys(bubble_anchors))
+        index = {name: i for i, name in enumerate(names)}
+        anchor_idx = np.array([index[name] for name in bubble_anchors], dtype=np.intp)
+        # dtype follows the file (int offsets stay ints), as the per-bubble additions did
+        self._bubble_layout = (q_nums, keys, names, anchor_idx, np.array(offsets).reshape(-1, 2))
+
+    def _transform_coordinates(self) -> None:
+        if not self.anchors or not self.omr_data:
+            return
+        if self._bubble_layout is None:
+            self._flatten_bubble_layout()
+        q_nums, keys, names, anchor_idx, offsets = self._bubble_layout
+        self._invalidate_overlays()
+        self.bubble_positions = {q_num: {} for q_num in q_nums}
+        if not keys:
+            return
+        # Bubbles whose anchor was not detected are left out, as before
+        found = np.array([name in self.anchors for name in names], dtype=bool)[anchor_idx]
+        anchor_xy = np.array([(self.anchors[name]['x'], self.anchors[name]['y']) if name in self.anchors else (0, 0)
+                              for name in names])
+        absolute = (anchor_xy[anchor_idx] + offsets).tolist()
+        for (q_num, option), keep, (x, y) in zip(keys, found.tolist(), absolute):
+            if keep:
+                self.bubble_positions[q_num][option] = (x, y)
 
     def _analyze_bubbles(self) -> None:
         if not self.current_image or not self.bubble_positions:
@@ -281,13 +374,18 @@ class ScannerWidget(QWidget):
         self.status_label.setText(translator.t('analyzing_bubbles'))
         if hasattr(self, 'worker') and self.worker.isRunning():
             self.worker.quit(); self.worker.wait()
-        self.worker = WorkerThread(BubbleAnalysisCommand(self.detector, self.current_image, self.bubble_positions))
+        positions = self.bubble_positions
+        if self._bubble_soa is None or self._bubble_soa[0] is not positions:
+            self._bubble_soa = (positions, *BubbleDetector.bubble_arrays(positions))
+        arrays = self._bubble_soa[1:]
+        self.worker = WorkerThread(BubbleAnalysisCommand(self.detector, self.current_image, positions, arrays))
         self.worker.result_ready.connect(self.on_analysis_complete)
         self.worker.start()
 
     def on_analysis_complete(self, result) -> None:
         if result['success']:
             self.analysis_results = result['results']
+            self._results_layer = None
             self.answers = result['answers']
             answered = sum(1 for a in self.answers.values() if a)
             total = len(self.answers)
@@ -309,76 +407,104 @@ class ScannerWidget(QWidget):
         if self.bubble_positions:
             self._analyze_bubbles()
 
+    def _bubble_visible(self, x: int, y: int, r: int) -> bool:
+        """True if a bubble of radius `r` at (x, y) overlaps the current image."""
+        width, height = self.current_image.size
+        return x + r > 0 and y + r > 0 and x - r < width and y - r < height
+
     def show_positions(self) -> None:
         if not self.current_image or not self.bubble_positions:
             return
         try:
-            overlay = self.current_image.copy()
-            draw = ImageDraw.Draw(overlay)
-            colors = {'A': 'red', 'B': 'green', 'C': 'blue', 'D': 'orange'}
-            for q_num, options in self.bubble_positions.items():
-                for option, (x, y) in options.items():
-                    x, y = int(x), int(y)
-                    r = int(self.detector.analysis_radius)
-                    x1, y1 = max(0, x-r), max(0, y-r)
-                    x2, y2 = min(overlay.width, x+r), min(overlay.height, y+r)
-                    if x2 > x1 and y2 > y1:
-                        draw.ellipse([x1, y1, x2, y2], outline=colors.get(option, 'purple'), width=AppConfig.OVERLAY_CIRCLE_OUTLINE_WIDTH)
-                        tx, ty = max(0, x-AppConfig.OVERLAY_TEXT_OFFSET_SMALL), max(0, y-AppConfig.OVERLAY_TEXT_OFFSET_VERTICAL)
-                        draw.text((tx, ty), option, fill=colors.get(option, 'purple'))
-                if 'A' in options:
-                    x, y = options['A']
-                    x, y = int(x), int(y)
-                    tx, ty = max(0, x-AppConfig.OVERLAY_LABEL_OFFSET_X), max(0, y-AppConfig.OVERLAY_TEXT_OFFSET_VERTICAL)
-                    draw.text((tx, ty), f"Q{q_num}", fill='black')
-            if self.anchors:
-                for name, data in self.anchors.items():
-                    x = int(data['x']); y = int(data['y']); w = int(data['width']); h = int(data['height'])
-                    x1, y1 = max(0, x), max(0, y)
-                    x2, y2 = min(overlay.width, x+w), min(overlay.height, y+h)
-                    if x2 > x1 and y2 > y1:
-                        draw.rectangle([x1, y1, x2, y2], outline='yellow', width=AppConfig.OVERLAY_ANCHOR_OUTLINE_WIDTH)
-                        draw.text((x1+2, y1+2), name.replace('_', ' ').title(), fill='yellow')
-            self.image_display.set_image(overlay)
-            self.update_zoom_info()
+            if self._positions_layer is None:
+                self._positions_layer = self._build_positions_layer()
+            self._show_overlay(self._positions_layer)
         except Exception as e:  # pragma: no cover
             self.image_display.set_image(self.current_image)
             self.log.exception("Error drawing positions overlay: %s", e)
 
+    def _build_positions_layer(self) -> Image.Image:
+        """Render bubble circles, option letters, question numbers and anchors."""
+        circles: List[Circle] = []
+        rects: List[Rect] = []
+        labels: List[Label] = []
+        r = int(self.detector.analysis_radius)
+        outline = AppConfig.OVERLAY_CIRCLE_OUTLINE_WIDTH
+        text_dx, text_dy = AppConfig.OVERLAY_TEXT_OFFSET_SMALL, AppConfig.OVERLAY_TEXT_OFFSET_VERTICAL
+        for q_num, options in self.bubble_positions.items():
+            for option, (x, y) in options.items():
+                x, y = int(x), int(y)
+                if self._bubble_visible(x, y, r):
+                    color = _OPTION_COLORS.get(option, _FALLBACK_COLOR)
+                    circles.append((x, y, r, color, outline))
+                    labels.append(((max(0, x - text_dx), max(0, y - text_dy)), option, color))
+            if 'A' in options:
+                x, y = options['A']
+                x, y = int(x), int(y)
+                tx, ty = max(0, x-AppConfig.OVERLAY_LABEL_OFFSET_X), max(0, y-text_dy)
+                labels.append(((tx, ty), f"Q{q_num}", _LABEL_COLOR))
+        if self.anchors:
+            width, height = self.current_image.size
+            for name, data in self.anchors.items():
+                x = int(data['x']); y = int(data['y']); w = int(data['width']); h = int(data['height'])
+                x1, y1 = max(0, x), max(0, y)
+                x2, y2 = min(width, x+w), min(height, y+h)
+                if x2 > x1 and y2 > y1:
+                    rects.append((x1, y1, x2, y2, _ANCHOR_COLOR, AppConfig.OVERLAY_ANCHOR_OUTLINE_WIDTH))
+                    labels.append(((x1+2, y1+2), name.replace('_', ' ').title(), _ANCHOR_COLOR))
+        return _render_layer(self.current_image.size, circles, rects, labels)
+
     def show_results(self) -> None:
         if not self.current_image or not self.analysis_results:
             return
         try:
-            overlay = self.current_image.copy()
-            draw = ImageDraw.Draw(overlay)
-            colors = {'A': 'red', 'B': 'green', 'C': 'blue', 'D': 'orange'}
-            for q_num, options in self.bubble_positions.items():
-                for option, (x, y) in options.items():
-                    if q_num in self.analysis_results and option in self.analysis_results[q_num]:
-                        result = self.analysis_results[q_num][option]
-                        x, y = int(x), int(y)
-                        r = int(self.detector.analysis_radius)
-                        x1, y1 = max(0, x-r), max(0, y-r)
-                        x2, y2 = min(overlay.width, x+r), min(overlay.height, y+r)
-                        if x2 > x1 and y2 > y1:
-                            thickness = max(1, int(result.darkness_score * AppConfig.BUBBLE_THICKNESS_SCALE))
-                            draw.ellipse([x1, y1, x2, y2], outline=colors.get(option, 'purple'), width=thickness)
-                            if result.is_filled:
-                                fx1, fy1 = max(0, x-AppConfig.BUBBLE_FILL_HALF_SIZE), max(0, y-AppConfig.BUBBLE_FILL_HALF_SIZE)
-                                fx2, fy2 = min(overlay.width, x+AppConfig.BUBBLE_FILL_HALF_SIZE), min(overlay.height, y+AppConfig.BUBBLE_FILL_HALF_SIZE)
-                                if fx2 > fx1 and fy2 > fy1:
-                                    draw.ellipse([fx1, fy1, fx2, fy2], fill=colors.get(option, 'purple'))
-            for q_num, answer in self.answers.items():
-                if answer and q_num in self.bubble_positions and answer in self.bubble_positions[q_num]:
-                    x, y = self.bubble_positions[q_num][answer]
-                    x, y = int(x), int(y)
-                    draw.text((max(0, x-50), max(0, y-8)), f"Q{q_num}→{answer}", fill='black')
-            self.image_display.set_image(overlay)
-            self.update_zoom_info()
+            if self._results_layer is None:
+                self._results_layer = self._build_results_layer()
+            self._show_overlay(self._results_layer)
         except Exception as e:  # pragma: no cover
             self.image_display.set_image(self.current_image)
             self.log.exception("Error drawing results overlay: %s", e)
 
+    def _build_results_layer(self) -> Image.Image:
+        """Render darkness-weighted bubble outlines, fill marks and detected answers."""
+        circles: List[Circle] = []
+        labels: List[Label] = []
+        r = int(self.detector.analysis_radius)
+        fill_r = AppConfig.BUBBLE_FILL_HALF_SIZE
+        for q_num, options in self.bubble_positions.items():
+            q_results = self.analysis_results.get(q_num)
+            if not q_results:
+                continue
+            for option, (x, y) in options.items():
+                result = q_results.get(option)
+                if result is None:
+                    continue
+                x, y = int(x), int(y)
+                if self._bubble_visible(x, y, r):
+                    color = _OPTION_COLORS.get(option, _FALLBACK_COLOR)
+                    thickness = max(1, int(result.darkness_score * AppConfig.BUBBLE_THICKNESS_SCALE))
+                    circles.append((x, y, r, color, thickness))
+                    if result.is_filled and self._bubble_visible(x, y, fill_r):
+                        circles.append((x, y, fill_r, color, -1))
+        for q_num, answer in self.answers.items():
+            if answer and q_num in self.bubble_positions and answer in self.bubble_positions[q_num]:
+                x, y = self.bubble_positions[q_num][answer]
+                x, y = int(x), int(y)
+                labels.append(((max(0, x-50), max(0, y-8)), f"Q{q_num}→{answer}", _LABEL_COLOR))
+        return _render_layer(self.current_image.size, circles, [], labels)
+
+    def _show_overlay(self, layer: Image.Image) -> None:
+        """Composite a cached overlay layer onto the scan and display it."""
+        if self._base_rgba is None:
+            self._base_rgba = self.current_image.convert('RGBA')
+        self.image_display.set_image(Image.alpha_composite(self._base_rgba, layer))
+        self.update_zoom_info()
+
+    def _invalidate_overlays(self) -> None:
+        """Drop rendered overlay layers after anchors or bubble positions change."""
+        self._positions_layer = None
+        self._results_layer = None
+
     # ================= View helpers =================
     def reset_view(self) -> None:
         if self.current_image:
@@ -386,8 +512,10 @@ class ScannerWidget(QWidget):
             self.update_zoom_info()
 
     def _reset_analysis(self) -> None:
+        self._invalidate_overlays()
         self.anchors = {}
         self.omr_data = None
+        self._bubble_layout = None
         self.bubble_positions = {}
         self.analysis_results = {}
         self.answers = {}
@@ -446,6 +574,7 @@ class ScannerWidget(QWidget):
             for q_num, bubbles in new_coordinates.items():
                 converted[q_num] = {opt: (data['x'], data['y']) for opt, data in bubbles.items() if isinstance(data, dict) and 'x' in data and 'y' in data}
             self.bubble_positions = converted
+            self._invalidate_overlays()
             if self.omr_data and 'bubble_coordinates' in self.omr_data:
                 for q_num, bubbles in new_coordinates.items():
                     if str(q_num) in self.omr_data['bubble_coordinates']:
@@ -1,6 +1,9 @@
+from functools import lru_cache
 from config.app_config import AppConfig
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
 from PyQt6.QtGui import QFont
-from PyQt6.QtWidgets import QTableWidget
+from PyQt6.QtWidgets import QAbstractItemView, QTableView
+from core.grading.grading_core import GradingSystem
 from i18n import translator
 
 
@@ -13,7 +16,7 @@ class TableManager:
     """
 
     @staticmethod
-    def configure_students_table(table: QTableWidget):
+    def configure_students_table(table: QTableView):
         """
         Set up a table for showing student results.
 
@@ -21,11 +24,11 @@ class TableManager:
         sorting, and all the visual polish that makes users happy.
 
         Args:
-            table (QTableWidget): The table widget to configure
+            table (QTableView): The table view to configure; its model (set
+                beforehand) supplies the columns
         """
-        # Basic setup - 6 columns should be enough for anyone
-        table.setColumnCount(6)  # Name, ID, Score, Total, Percentage, Grade
-        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)  # Select whole rows (less confusing)
+        # Columns come from the model: Name, ID, Score, Total, Percentage, Grade
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)  # Select whole rows (less confusing)
         table.setAlternatingRowColors(True)  # Zebra stripes make it easier to read
         table.setSortingEnabled(True)  # Let people sort by clicking headers
 
@@ -73,3 +76,105 @@ class TableManager:
         # If translations are missing, fall back to English
         fallback_headers = ["Name", "ID", "Score", "Total", "Percentage", "Grade"]
         return [h.strip() if h.strip() else fallback_headers[i] for i, h in enumerate(headers)]
+
+
+# Flyweight cell texts: scores, totals and percentages repeat across a class,
+# so each distinct value is formatted once and the string is shared by every
+# row (and every repaint) that shows it
+_int_text = lru_cache(maxsize=1024, typed=True)(str)
+
+
+@lru_cache(maxsize=1024)
+def _percent_text(percentage: float) -> str:
+    return f"{percentage:.1f}%"
+
+
+# Cell text and sort key per column: Name, ID, Score, Total, Percentage, Grade
+_RESULT_COLUMNS = (
+    (lambda r: r.student_name, lambda r: r.student_name),
+    (lambda r: r.student_id, lambda r: r.student_id),
+    (lambda r: _int_text(r.score), lambda r: r.score),
+    (lambda r: _int_text(r.total_possible), lambda r: r.total_possible),
+    (lambda r: _percent_text(r.percentage), lambda r: r.percentage),
+    (lambda r: r.letter_grade, lambda r: r.percentage),
+)
+
+
+class GradeResultsModel(QAbstractTableModel):
+    """
+    Student results as a table model, read straight from a GradingSystem.
+
+    Cells are formatted only when the view asks for them, so the view
+    renders just the visible rows and adding or removing a student touches
+    a single row instead of rebuilding the table. The model tracks how many
+    results it has announced to the view; `sync` publishes any results the
+    grading system appended since.
+    """
+
+    def __init__(self, grading_system: GradingSystem, parent=None):
+        super().__init__(parent)
+        self._grading = grading_system
+        self._count = len(grading_system.results)
+        self._headers = TableManager.get_translated_headers()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._count
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(_RESULT_COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return _RESULT_COLUMNS[index.column()][0](self._grading.results[index.row()])
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def set_headers(self, headers) -> None:
+        """Replace the column titles (e.g. after a language change)."""
+        self._headers = list(headers)
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(self._headers) - 1)
+
+    def sync(self) -> None:
+        """Show results appended to the grading system since the last call."""
+        total = len(self._grading.results)
+        if total > self._count:
+            self.beginInsertRows(QModelIndex(), self._count, total - 1)
+            self._count = total
+            self.endInsertRows()
+        elif total != self._count:
+            self.beginResetModel()
+            self._count = total
+            self.endResetModel()
+
+    def remove_row(self, row: int) -> None:
+        """Drop one result from the grading system and the view."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._grading.remove_result(row)
+        self._count -= 1
+        self.endRemoveRows()
+
+    def clear(self) -> None:
+        """Drop every result from the grading system and the view."""
+        self.beginResetModel()
+        self._grading.clear()
+        self._count = 0
+        self.endResetModel()
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder) -> None:
+        """Sort the underlying results in place so rows keep matching result indices."""
+        results = self._grading.results
+        key = _RESULT_COLUMNS[column][1]
+        self.layoutAboutToBeChanged.emit()
+        order_rows = sorted(range(len(results)), key=lambda i: key(results[i]),
+                            reverse=order == Qt.SortOrder.DescendingOrder)
+        results[:] = [results[i] for i in order_rows]
+        new_row = {old: new for new, old in enumerate(order_rows)}
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes, [self.index(new_row[i.row()], i.column()) for i in old_indexes]
+        )
+        self.layoutChanged.emit()
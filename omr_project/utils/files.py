@@ -1,8 +1,56 @@
+import json
 from datetime import datetime
+from typing import Any, Dict
 from config.app_config import AppConfig
+try:
+    import orjson  # type: ignore
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    ORJSON_AVAILABLE = False
 
 
 def build_timestamped_filename(stem: str, ext: str, fmt: str = AppConfig.TIMESTAMP_FMT) -> str:
     ts = datetime.now().strftime(fmt)
     return f"{stem}_{ts}.{ext}"
 
+
+
+def write_json(filename: str, data: Any) -> None:
+    """Write `data` as indented UTF-8 JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        # Integer keys (e.g. question numbers) are stringified just like the json module does
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def read_json(filename: str) -> Any:
+    """Parse a UTF-8 JSON file, using orjson when it is installed."""
+    with open(filename, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw.decode('utf-8'))
+
+
+class JsonLoadCommand:
+    """Worker command parsing a JSON file off the UI thread."""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+
+    def execute(self) -> Dict[str, Any]:  # noqa: D401
+        return {'success': True, 'filename': self.filename, 'data': read_json(self.filename), 'message': ''}
+
+
+class JsonExportCommand:
+    """Worker command writing an already-built export payload to disk."""
+
+    def __init__(self, data: Dict[str, Any], filename: str, kind: str):
+        self.data = data
+        self.filename = filename
+        self.kind = kind
+
+    def execute(self) -> Dict[str, Any]:  # noqa: D401
+        write_json(self.filename, self.data)
+        return {'success': True, 'filename': self.filename, 'kind': self.kind, 'message': ''}
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from config.app_config import AppConfig
 from reportlab.lib.pagesizes import letter, A4, landscape
 
@@ -11,9 +13,15 @@ def get_page_size_inches() -> tuple[float, float]:
     return width, height
 
 
+@lru_cache(maxsize=8)
+def _reportlab_pagesize(size: str, orient: str):
+    base = {'a4': A4, 'letter': letter}.get(size, letter)
+    return landscape(base) if orient == 'landscape' else base
+
+
 def get_reportlab_pagesize():
     """Return ReportLab pagesize object matching config size and orientation."""
     size = (AppConfig.DEFAULT_PAGE_SIZE.value if hasattr(AppConfig.DEFAULT_PAGE_SIZE, 'value') else str(AppConfig.DEFAULT_PAGE_SIZE)).lower()
-    base = {'a4': A4, 'letter': letter}.get(size, letter)
     orient = (AppConfig.DEFAULT_PAGE_ORIENTATION.value if hasattr(AppConfig.DEFAULT_PAGE_ORIENTATION, 'value') else str(AppConfig.DEFAULT_PAGE_ORIENTATION)).lower()
-    return landscape(base) if orient == 'landscape' else base
+    # Memoized on the config values themselves, so settings changes never see a stale size
+    return _reportlab_pagesize(size, orient)